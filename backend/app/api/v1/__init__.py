@@ -1,10 +1,11 @@
 """API v1 router configuration."""
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.endpoints import health, servers, services
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include endpoint routers
 api_router.include_router(health.router, prefix="/health", tags=["health"])
@@ -1,52 +1,117 @@
 """Health check endpoints."""
 
-from datetime import datetime
-from typing import Dict, Any
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, Tuple
+
+import orjson
 
 from fastapi import APIRouter, Depends
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
-from app.database import get_db
+from app.database import get_db_readonly
 
 router = APIRouter()
 
+# Settings are immutable for the process lifetime, so resolve the static
+# parts of the health payload once instead of on every probe.
+_SETTINGS = get_settings()
+_BASE = {"service": _SETTINGS.app_name, "version": _SETTINGS.version}
 
-@router.get("/")
-async def health_check() -> Dict[str, Any]:
-    """Basic health check endpoint."""
-    settings = get_settings()
+# Connectivity probe statement, built once and reused by every detailed check
+_PING = text("SELECT 1")
+
+# Upper bound for a single component probe, so one hanging dependency
+# cannot stall the whole detailed check
+_PROBE_TIMEOUT_SECONDS = 0.5
+
+# (epoch second, ISO string) of the last rendered timestamp
+_last_timestamp: Tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601, reused for probes within the same second."""
+    global _last_timestamp
+    second = int(time.time())
+    if second != _last_timestamp[0]:
+        _last_timestamp = (
+            second,
+            datetime.fromtimestamp(second, timezone.utc).isoformat(),
+        )
+    return _last_timestamp[1]
+
+
+def _health_payload() -> Dict[str, Any]:
+    """Liveness payload shared by the routed endpoint and the fast path."""
     return {
         "status": "healthy",
-        "service": settings.app_name,
-        "version": settings.version,
-        "timestamp": datetime.utcnow().isoformat(),
+        **_BASE,
+        "timestamp": _utc_timestamp(),
     }
 
 
+# (timestamp, encoded body) of the last rendered liveness response
+_last_body: Tuple[str, bytes] = ("", b"")
+
+
+def render_health_check() -> bytes:
+    """Encoded liveness response, re-rendered at most once per second."""
+    global _last_body
+    timestamp = _utc_timestamp()
+    if timestamp != _last_body[0]:
+        _last_body = (timestamp, orjson.dumps(_health_payload()))
+    return _last_body[1]
+
+
+async def _probe_database(db: AsyncSession) -> None:
+    """Check database connectivity."""
+    await db.execute(_PING)
+
+
+@router.get("/")
+async def health_check() -> Dict[str, Any]:
+    """Basic health check endpoint.
+
+    In the running app requests are answered by the fast path installed in
+    ``app.main``; this route keeps the endpoint in the OpenAPI schema.
+    """
+    return _health_payload()
+
+
 @router.get("/detailed")
-async def detailed_health_check(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+async def detailed_health_check(
+    db: AsyncSession = Depends(get_db_readonly),
+) -> Dict[str, Any]:
     """Detailed health check including database connectivity."""
-    settings = get_settings()
+    probes = {
+        "database": _probe_database(db),
+    }
+
+    # Run all component probes concurrently, each with its own timeout
+    results = await asyncio.gather(
+        *(asyncio.wait_for(probe, _PROBE_TIMEOUT_SECONDS) for probe in probes.values()),
+        return_exceptions=True,
+    )
+
+    components: Dict[str, Dict[str, Any]] = {}
+    for name, result in zip(probes, results):
+        if isinstance(result, asyncio.TimeoutError):
+            components[name] = {"status": "unhealthy", "error": "Probe timed out"}
+        elif isinstance(result, Exception):
+            components[name] = {"status": "unhealthy", "error": str(result)}
+        else:
+            components[name] = {"status": "healthy", "error": None}
 
-    # Test database connection
-    try:
-        await db.execute("SELECT 1")
-        db_status = "healthy"
-        db_error = None
-    except Exception as e:
-        db_status = "unhealthy"
-        db_error = str(e)
+    all_healthy = all(
+        component["status"] == "healthy" for component in components.values()
+    )
 
     return {
-        "status": "healthy" if db_status == "healthy" else "degraded",
-        "service": settings.app_name,
-        "version": settings.version,
-        "timestamp": datetime.utcnow().isoformat(),
-        "components": {
-            "database": {
-                "status": db_status,
-                "error": db_error,
-            }
-        },
+        "status": "healthy" if all_healthy else "degraded",
+        **_BASE,
+        "timestamp": _utc_timestamp(),
+        "components": components,
     }
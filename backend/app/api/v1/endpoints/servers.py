@@ -1,14 +1,14 @@
 """Server management API endpoints."""
 
-import math
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Dict, Optional
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_db_readonly
 from app.models.server import ServerStatus
 from app.schemas.server import (
     ServerCreateRequest,
@@ -21,6 +21,7 @@ from app.schemas.server import (
     ServerStatsResponse,
 )
 from app.services.server_service import server_service
+from app.utils.http import PydanticResponse, tag_filters
 
 logger = structlog.get_logger()
 router = APIRouter()
@@ -37,33 +38,17 @@ async def create_server(
     server_data: ServerCreateRequest, db: AsyncSession = Depends(get_db)
 ) -> ServerResponse:
     """Create a new server."""
-    try:
-        # Check if hostname already exists
-        existing_server = await server_service.get_server_by_hostname(
-            db, server_data.hostname
-        )
-        if existing_server:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Server with hostname '{server_data.hostname}' already exists",
-            )
+    server = await server_service.create_server(db, server_data)
 
-        server = await server_service.create_server(db, server_data)
-
-        logger.info(
-            "Server created via API", server_id=server.id, hostname=server.hostname
+    if not server:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Server with hostname '{server_data.hostname}' already exists",
         )
 
-        return server
+    logger.info("Server created via API", server_id=server.id, hostname=server.hostname)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to create server via API", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create server",
-        )
+    return server
 
 
 @router.get(
@@ -78,32 +63,31 @@ async def list_servers(
     search: Optional[str] = Query(
         None, description="Search in hostname, display name, description, or IP"
     ),
-    status: Optional[ServerStatus] = Query(None, description="Filter by server status"),
+    status_filter: Optional[ServerStatus] = Query(
+        None, alias="status", description="Filter by server status"
+    ),
     enabled_only: bool = Query(False, description="Show only enabled servers"),
-    db: AsyncSession = Depends(get_db),
-) -> ServerListResponse:
+    tags: Optional[Dict[str, str]] = Depends(tag_filters),
+    db: AsyncSession = Depends(get_db_readonly),
+) -> Response:
     """List servers with pagination and filtering."""
-    try:
-        servers, total = await server_service.list_servers(
-            db, page, per_page, search, status, enabled_only
-        )
-
-        total_pages = math.ceil(total / per_page) if total > 0 else 1
+    servers, total = await server_service.list_servers(
+        db, page, per_page, search, status_filter, enabled_only, tags
+    )
 
-        return ServerListResponse(
-            servers=servers,
-            total=total,
-            page=page,
-            per_page=per_page,
-            total_pages=total_pages,
-        )
+    total_pages = -(-total // per_page) or 1
 
-    except Exception as e:
-        logger.error("Failed to list servers via API", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to list servers",
-        )
+    # The service already built the models from database rows, so the
+    # envelope is constructed without validation and returned directly,
+    # skipping FastAPI's second validation pass against response_model
+    server_list = ServerListResponse.model_construct(
+        servers=servers,
+        total=total,
+        page=page,
+        per_page=per_page,
+        total_pages=total_pages,
+    )
+    return PydanticResponse(server_list)
 
 
 @router.get(
@@ -113,7 +97,7 @@ async def list_servers(
     description="Get detailed information about a specific server.",
 )
 async def get_server(
-    server_id: int, db: AsyncSession = Depends(get_db)
+    server_id: int, db: AsyncSession = Depends(get_db_readonly)
 ) -> ServerResponse:
     """Get server by ID."""
     server = await server_service.get_server(db, server_id)
@@ -137,31 +121,17 @@ async def update_server(
     server_id: int, server_data: ServerUpdateRequest, db: AsyncSession = Depends(get_db)
 ) -> ServerResponse:
     """Update server configuration."""
-    try:
-        server = await server_service.update_server(db, server_id, server_data)
-
-        if not server:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Server with ID {server_id} not found",
-            )
+    server = await server_service.update_server(db, server_id, server_data)
 
-        logger.info(
-            "Server updated via API", server_id=server_id, hostname=server.hostname
+    if not server:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Server with ID {server_id} not found",
         )
 
-        return server
+    logger.info("Server updated via API", server_id=server_id, hostname=server.hostname)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to update server via API", server_id=server_id, error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update server",
-        )
+    return server
 
 
 @router.delete(
@@ -172,28 +142,16 @@ async def update_server(
 )
 async def delete_server(server_id: int, db: AsyncSession = Depends(get_db)) -> None:
     """Delete server and all its services."""
-    try:
-        success = await server_service.delete_server(db, server_id)
+    success = await server_service.delete_server(db, server_id)
 
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Server with ID {server_id} not found",
-            )
-
-        logger.info("Server deleted via API", server_id=server_id)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to delete server via API", server_id=server_id, error=str(e)
-        )
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete server",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Server with ID {server_id} not found",
         )
 
+    logger.info("Server deleted via API", server_id=server_id)
+
 
 @router.post(
     "/{server_id}/test-connection",
@@ -216,7 +174,7 @@ async def test_server_connection(
             success=success,
             message=message,
             response_time_ms=response_time_ms,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
     except Exception as e:
@@ -230,7 +188,7 @@ async def test_server_connection(
             success=False,
             message=f"Connection test error: {str(e)}",
             response_time_ms=None,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
 
@@ -244,30 +202,18 @@ async def gather_server_info(
     server_id: int, db: AsyncSession = Depends(get_db)
 ) -> ServerSystemInfoResponse:
     """Gather system information from server."""
-    try:
-        system_info = await server_service.gather_system_info(db, server_id)
-
-        if not system_info:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Server with ID {server_id} not found or not accessible",
-            )
+    system_info = await server_service.gather_system_info(db, server_id)
 
-        logger.info("System info gathered via API", server_id=server_id)
-
-        return system_info
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to gather system info via API", server_id=server_id, error=str(e)
-        )
+    if not system_info:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to gather system information",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Server with ID {server_id} not found or not accessible",
         )
 
+    logger.info("System info gathered via API", server_id=server_id)
+
+    return system_info
+
 
 @router.get(
     "/stats/overview",
@@ -275,15 +221,9 @@ async def gather_server_info(
     summary="Get server statistics",
     description="Get overview statistics for all servers.",
 )
-async def get_server_stats(db: AsyncSession = Depends(get_db)) -> ServerStatsResponse:
+async def get_server_stats(
+    db: AsyncSession = Depends(get_db_readonly),
+) -> ServerStatsResponse:
     """Get server statistics overview."""
-    try:
-        stats = await server_service.get_server_stats(db)
-        return stats
-
-    except Exception as e:
-        logger.error("Failed to get server stats via API", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get server statistics",
-        )
+    stats = await server_service.get_server_stats(db)
+    return stats
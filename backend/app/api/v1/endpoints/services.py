@@ -1,15 +1,21 @@
 """Service management API endpoints."""
 
-import math
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_db_readonly
 from app.models.service import ServiceStatus, ServiceType
 from app.schemas.service import (
+    EnhancedServiceCreateRequest,
+    RestartPolicy,
+    SystemdServiceType,
+    TimerConfiguration,
     ServiceControlRequest,
     ServiceControlResponse,
     ServiceLogsResponse,
@@ -17,6 +23,7 @@ from app.schemas.service import (
     ServiceListResponse,
     ServiceDiscoveryRequest,
     ServiceDiscoveryResponse,
+    ServiceDiscoveryJobResponse,
     ServiceStatsResponse,
     ServiceUpdateRequest,
     ServiceUpdateResponse,
@@ -28,10 +35,164 @@ from app.schemas.service import (
     ServiceTemplateResponse,
 )
 from app.services.service_service import service_service
+from app.services.ssh_manager import SSHCommandError, SSHConnectionError
+from app.utils.http import (
+    PydanticResponse,
+    compute_etag,
+    etag_matches,
+    tag_filters,
+)
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# HTTP status for each ServiceUpdateResponse.error_kind
+_ERROR_KIND_STATUS = {
+    "not_found": status.HTTP_404_NOT_FOUND,
+    "invalid": status.HTTP_400_BAD_REQUEST,
+    "conflict": status.HTTP_409_CONFLICT,
+}
+
+# Templates are static, so they are built once at import time
+_TEMPLATES: Dict[str, ServiceTemplateResponse] = {
+    "python": ServiceTemplateResponse(
+        template_name="python-app",
+        description="Python application service with uv",
+        service_config=EnhancedServiceCreateRequest(
+            name="my-python-app",
+            display_name="My Python Application",
+            description="A Python application service",
+            systemd_type=SystemdServiceType.SIMPLE,
+            exec_start="uv run python main.py",
+            restart_policy=RestartPolicy.ON_FAILURE,
+            user="app",
+            group="app",
+            working_directory="/opt/app",
+            environment_variables={
+                "PYTHONPATH": "/opt/app",
+                "ENV": "production",
+            },
+            standard_output="journal",
+            standard_error="journal",
+            auto_start=True,
+            auto_enable=True,
+        ),
+        required_parameters=["name", "exec_start", "working_directory"],
+        optional_parameters=["user", "group", "environment_variables"],
+    ),
+    "timer": ServiceTemplateResponse(
+        template_name="scheduled-task",
+        description="Scheduled task service with timer",
+        service_config=EnhancedServiceCreateRequest(
+            name="my-scheduled-task",
+            display_name="My Scheduled Task",
+            description="A scheduled task service",
+            systemd_type=SystemdServiceType.ONESHOT,
+            exec_start="/usr/bin/python3 /opt/scripts/task.py",
+            restart_policy=RestartPolicy.NO,
+            user="scripts",
+            group="scripts",
+            working_directory="/opt/scripts",
+            standard_output="journal",
+            standard_error="journal",
+            create_timer=True,
+            timer_config=TimerConfiguration(
+                on_calendar="daily", persistent=True, accuracy_sec="1min"
+            ),
+            auto_start=False,
+            auto_enable=True,
+        ),
+        required_parameters=["name", "exec_start", "timer_config"],
+        optional_parameters=["user", "group", "working_directory"],
+    ),
+    "web": ServiceTemplateResponse(
+        template_name="web-service",
+        description="Web service with networking",
+        service_config=EnhancedServiceCreateRequest(
+            name="my-web-service",
+            display_name="My Web Service",
+            description="A web service",
+            systemd_type=SystemdServiceType.SIMPLE,
+            exec_start="/usr/bin/node server.js",
+            restart_policy=RestartPolicy.ON_FAILURE,
+            restart_sec=5,
+            user="www-data",
+            group="www-data",
+            working_directory="/opt/webapp",
+            environment_variables={
+                "NODE_ENV": "production",
+                "PORT": "3000",
+            },
+            after_units=["network.target"],
+            wants_units=["network.target"],
+            standard_output="journal",
+            standard_error="journal",
+            auto_start=True,
+            auto_enable=True,
+        ),
+        required_parameters=["name", "exec_start", "working_directory"],
+        optional_parameters=[
+            "user",
+            "group",
+            "environment_variables",
+            "after_units",
+        ],
+    ),
+    "backup": ServiceTemplateResponse(
+        template_name="backup-script",
+        description="Backup script with timer",
+        service_config=EnhancedServiceCreateRequest(
+            name="backup-service",
+            display_name="Backup Service",
+            description="Automated backup service",
+            systemd_type=SystemdServiceType.ONESHOT,
+            exec_start="/opt/scripts/backup.sh",
+            restart_policy=RestartPolicy.ON_FAILURE,
+            user="backup",
+            group="backup",
+            working_directory="/opt/scripts",
+            environment_variables={
+                "BACKUP_DIR": "/backups",
+                "RETENTION_DAYS": "30",
+            },
+            create_timer=True,
+            timer_config=TimerConfiguration(
+                on_calendar="*-*-* 02:00:00",  # Daily at 2 AM
+                persistent=True,
+                accuracy_sec="5min",
+            ),
+            standard_output="journal",
+            standard_error="journal",
+            auto_start=False,
+            auto_enable=True,
+        ),
+        required_parameters=["name", "exec_start"],
+        optional_parameters=["environment_variables", "timer_config"],
+    ),
+}
+
+# Encoded response bodies for every possible filter value; None lists all
+_TEMPLATES_JSON: Dict[Optional[str], bytes] = {
+    None: orjson.dumps(
+        [template.model_dump(mode="json") for template in _TEMPLATES.values()]
+    ),
+    **{
+        key: orjson.dumps([template.model_dump(mode="json")])
+        for key, template in _TEMPLATES.items()
+    },
+}
+_TEMPLATES_ETAGS: Dict[Optional[str], str] = {
+    key: compute_etag(content) for key, content in _TEMPLATES_JSON.items()
+}
+_EMPTY_TEMPLATES_ETAG = compute_etag(b"[]")
+
+
+def _service_etag(service_id: int, updated_at: datetime, server_hostname: str) -> str:
+    """ETag for a service detail response, derived from its row version."""
+    return compute_etag(
+        f"{service_id}:{updated_at.isoformat()}:{server_hostname}".encode()
+    )
+
 
 @router.get(
     "/",
@@ -53,40 +214,76 @@ async def list_services(
         None, description="Filter by service type"
     ),
     enabled_only: bool = Query(False, description="Show only enabled services"),
-    db: AsyncSession = Depends(get_db),
-) -> ServiceListResponse:
+    after_id: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Return services with an ID greater than this cursor, ordered by ID (replaces page)",
+    ),
+    with_count: bool = Query(
+        True, description="Compute total and total_pages (skip for infinite scroll)"
+    ),
+    tags: Optional[Dict[str, str]] = Depends(tag_filters),
+    db: AsyncSession = Depends(get_db_readonly),
+) -> Response:
     """List services with pagination and filtering."""
-    try:
-        services, total = await service_service.list_services(
-            db,
-            page,
-            per_page,
-            server_id,
-            search,
-            status_filter,
-            service_type,
-            enabled_only,
-        )
+    services, total = await service_service.list_services(
+        db,
+        page,
+        per_page,
+        server_id,
+        search,
+        status_filter,
+        service_type,
+        enabled_only,
+        after_id,
+        with_count,
+        tags,
+    )
+
+    total_pages = (-(-total // per_page) or 1) if total is not None else None
+    next_cursor = (
+        services[-1].id if after_id is not None and len(services) == per_page else None
+    )
+
+    # The service already built the models from database rows, so the
+    # envelope is constructed without validation and returned directly,
+    # skipping FastAPI's second validation pass against response_model
+    service_list = ServiceListResponse.model_construct(
+        services=services,
+        total=total,
+        page=page,
+        per_page=per_page,
+        total_pages=total_pages,
+        server_id=server_id,
+        status_filter=status_filter.value if status_filter else None,
+        search_query=search,
+        next_cursor=next_cursor,
+    )
+    return PydanticResponse(service_list)
 
-        total_pages = math.ceil(total / per_page) if total > 0 else 1
 
-        return ServiceListResponse(
-            services=services,
-            total=total,
-            page=page,
-            per_page=per_page,
-            total_pages=total_pages,
-            server_id=server_id,
-            status_filter=status_filter.value if status_filter else None,
-            search_query=search,
-        )
+@router.get(
+    "/templates",
+    response_model=List[ServiceTemplateResponse],
+    summary="Get service templates",
+    description="Get available service templates for common service types.",
+)
+async def get_service_templates(
+    template_type: Optional[str] = Query(None, description="Filter by template type")
+) -> Response:
+    """Get available service templates."""
+    key = template_type or None
+    content = _TEMPLATES_JSON.get(key, b"[]")
+    etag = _TEMPLATES_ETAGS.get(key, _EMPTY_TEMPLATES_ETAG)
 
-    except Exception as e:
-        logger.error("Failed to list services via API", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to list services",
-        )
+    # Read-only success paths log at DEBUG, which the filtering bound logger
+    # drops without running the processor chain
+    logger.debug("Service templates retrieved via API", template_type=template_type)
+
+    # ETagMiddleware answers matching If-None-Match requests with 304
+    return Response(
+        content=content, media_type="application/json", headers={"ETag": etag}
+    )
 
 
 @router.get(
@@ -96,9 +293,22 @@ async def list_services(
     description="Get detailed information about a specific service.",
 )
 async def get_service(
-    service_id: int, db: AsyncSession = Depends(get_db)
-) -> ServiceResponse:
+    service_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db_readonly),
+) -> Response:
     """Get service by ID."""
+    if if_none_match:
+        # Revalidate against the row version before loading the service
+        version = await service_service.get_service_version(db, service_id)
+        if version:
+            etag = _service_etag(service_id, *version)
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag},
+                )
+
     service = await service_service.get_service(db, service_id)
 
     if not service:
@@ -107,7 +317,15 @@ async def get_service(
             detail=f"Service with ID {service_id} not found",
         )
 
-    return service
+    return Response(
+        content=service.model_dump_json(),
+        media_type="application/json",
+        headers={
+            "ETag": _service_etag(
+                service_id, service.updated_at, service.server_hostname
+            )
+        },
+    )
 
 
 @router.post(
@@ -123,14 +341,6 @@ async def control_service(
 ) -> ServiceControlResponse:
     """Control a service (start, stop, restart, etc.)."""
     try:
-        # Validate action
-        valid_actions = ["start", "stop", "restart", "reload", "enable", "disable"]
-        if control_request.action not in valid_actions:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid action '{control_request.action}'. Valid actions: {', '.join(valid_actions)}",
-            )
-
         response = await service_service.control_service(
             db, service_id, control_request.action
         )
@@ -146,19 +356,6 @@ async def control_service(
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to control service via API",
-            service_id=service_id,
-            action=control_request.action,
-            error=str(e),
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to control service",
-        )
 
 
 @router.get(
@@ -180,7 +377,7 @@ async def get_service_logs(
     grep: Optional[str] = Query(
         None, description="Filter logs containing this text pattern"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
 ) -> ServiceLogsResponse:
     """Get logs for a service."""
     try:
@@ -188,7 +385,7 @@ async def get_service_logs(
             db, service_id, lines, since, until, priority, grep
         )
 
-        logger.info(
+        logger.debug(
             "Service logs retrieved via API",
             service_id=service_id,
             lines_returned=logs_response.lines_returned,
@@ -198,15 +395,53 @@ async def get_service_logs(
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        logger.error(
-            "Failed to get service logs via API", service_id=service_id, error=str(e)
+
+
+@router.get(
+    "/{service_id}/logs/stream",
+    summary="Stream service logs",
+    description='Stream logs for a specific service as newline-delimited JSON strings, one per log line. If journalctl fails, the stream ends with an {"error": ...} object.',
+    response_class=StreamingResponse,
+)
+async def stream_service_logs(
+    service_id: int,
+    lines: int = Query(
+        100, ge=1, le=10000, description="Number of log lines to retrieve"
+    ),
+    since: Optional[str] = Query(None, description="Show logs since this time"),
+    until: Optional[str] = Query(None, description="Show logs until this time"),
+    priority: Optional[str] = Query(
+        None, description="Filter logs by minimum priority level"
+    ),
+    grep: Optional[str] = Query(
+        None, description="Filter logs containing this text pattern"
+    ),
+    db: AsyncSession = Depends(get_db_readonly),
+) -> StreamingResponse:
+    """Stream logs for a service."""
+    try:
+        log_lines = await service_service.stream_service_logs(
+            db, service_id, lines, since, until, priority, grep
         )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except SSHConnectionError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve service logs",
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"SSH connection failed: {str(e)}",
         )
 
+    async def encode() -> AsyncIterator[bytes]:
+        try:
+            async for line in log_lines:
+                yield orjson.dumps(line) + b"\n"
+        except SSHCommandError as e:
+            # The status line is already sent, so report the failure as a
+            # final record instead
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+
+    return StreamingResponse(encode(), media_type="application/x-ndjson")
+
 
 @router.post(
     "/discover/{server_id}",
@@ -238,206 +473,58 @@ async def discover_services(
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        logger.error(
-            "Failed to discover services via API", server_id=server_id, error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to discover services",
-        )
 
 
-@router.get(
-    "/stats/overview",
-    response_model=ServiceStatsResponse,
-    summary="Get service statistics",
-    description="Get overview statistics for all services.",
+@router.post(
+    "/discover/{server_id}/jobs",
+    response_model=ServiceDiscoveryJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start service discovery",
+    description="Queue service discovery on a server and return a job to poll for the result.",
 )
-async def get_service_stats(db: AsyncSession = Depends(get_db)) -> ServiceStatsResponse:
-    """Get service statistics overview."""
-    try:
-        stats = await service_service.get_service_stats(db)
-        return stats
-
-    except Exception as e:
-        logger.error("Failed to get service stats via API", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get service statistics",
-        )
+async def start_service_discovery(
+    server_id: int,
+    discovery_request: ServiceDiscoveryRequest = ServiceDiscoveryRequest(),
+) -> ServiceDiscoveryJobResponse:
+    """Queue background service discovery on a server."""
+    return service_service.start_discovery_job(
+        server_id, discovery_request.force_refresh
+    )
 
 
 @router.get(
-    "/templates",
-    response_model=List[ServiceTemplateResponse],
-    summary="Get service templates",
-    description="Get available service templates for common service types.",
+    "/discover/{server_id}/status/{job_id}",
+    response_model=ServiceDiscoveryJobResponse,
+    summary="Get service discovery status",
+    description="Get the status and, once finished, the results of a discovery job.",
 )
-async def get_service_templates(
-    template_type: Optional[str] = Query(None, description="Filter by template type")
-) -> List[ServiceTemplateResponse]:
-    """Get available service templates."""
-    try:
-        # Define common service templates
-        templates = []
-
-        # Python Application Template
-        if not template_type or template_type == "python":
-            from app.schemas.service import (
-                EnhancedServiceCreateRequest,
-                SystemdServiceType,
-                RestartPolicy,
-            )
-
-            templates.append(
-                ServiceTemplateResponse(
-                    template_name="python-app",
-                    description="Python application service with uv",
-                    service_config=EnhancedServiceCreateRequest(
-                        name="my-python-app",
-                        display_name="My Python Application",
-                        description="A Python application service",
-                        systemd_type=SystemdServiceType.SIMPLE,
-                        exec_start="uv run python main.py",
-                        restart_policy=RestartPolicy.ON_FAILURE,
-                        user="app",
-                        group="app",
-                        working_directory="/opt/app",
-                        environment_variables={
-                            "PYTHONPATH": "/opt/app",
-                            "ENV": "production",
-                        },
-                        standard_output="journal",
-                        standard_error="journal",
-                        auto_start=True,
-                        auto_enable=True,
-                    ),
-                    required_parameters=["name", "exec_start", "working_directory"],
-                    optional_parameters=["user", "group", "environment_variables"],
-                )
-            )
-
-        # Timer Service Template
-        if not template_type or template_type == "timer":
-            from app.schemas.service import TimerConfiguration
-
-            templates.append(
-                ServiceTemplateResponse(
-                    template_name="scheduled-task",
-                    description="Scheduled task service with timer",
-                    service_config=EnhancedServiceCreateRequest(
-                        name="my-scheduled-task",
-                        display_name="My Scheduled Task",
-                        description="A scheduled task service",
-                        systemd_type=SystemdServiceType.ONESHOT,
-                        exec_start="/usr/bin/python3 /opt/scripts/task.py",
-                        restart_policy=RestartPolicy.NO,
-                        user="scripts",
-                        group="scripts",
-                        working_directory="/opt/scripts",
-                        standard_output="journal",
-                        standard_error="journal",
-                        create_timer=True,
-                        timer_config=TimerConfiguration(
-                            on_calendar="daily", persistent=True, accuracy_sec="1min"
-                        ),
-                        auto_start=False,
-                        auto_enable=True,
-                    ),
-                    required_parameters=["name", "exec_start", "timer_config"],
-                    optional_parameters=["user", "group", "working_directory"],
-                )
-            )
+async def get_service_discovery_status(
+    server_id: int, job_id: str
+) -> ServiceDiscoveryJobResponse:
+    """Get a background service discovery job."""
+    job = service_service.get_discovery_job(job_id)
 
-        # Web Service Template
-        if not template_type or template_type == "web":
-            templates.append(
-                ServiceTemplateResponse(
-                    template_name="web-service",
-                    description="Web service with networking",
-                    service_config=EnhancedServiceCreateRequest(
-                        name="my-web-service",
-                        display_name="My Web Service",
-                        description="A web service",
-                        systemd_type=SystemdServiceType.SIMPLE,
-                        exec_start="/usr/bin/node server.js",
-                        restart_policy=RestartPolicy.ON_FAILURE,
-                        restart_sec=5,
-                        user="www-data",
-                        group="www-data",
-                        working_directory="/opt/webapp",
-                        environment_variables={
-                            "NODE_ENV": "production",
-                            "PORT": "3000",
-                        },
-                        after_units=["network.target"],
-                        wants_units=["network.target"],
-                        standard_output="journal",
-                        standard_error="journal",
-                        auto_start=True,
-                        auto_enable=True,
-                    ),
-                    required_parameters=["name", "exec_start", "working_directory"],
-                    optional_parameters=[
-                        "user",
-                        "group",
-                        "environment_variables",
-                        "after_units",
-                    ],
-                )
-            )
-
-        # Backup Script Template
-        if not template_type or template_type == "backup":
-            templates.append(
-                ServiceTemplateResponse(
-                    template_name="backup-script",
-                    description="Backup script with timer",
-                    service_config=EnhancedServiceCreateRequest(
-                        name="backup-service",
-                        display_name="Backup Service",
-                        description="Automated backup service",
-                        systemd_type=SystemdServiceType.ONESHOT,
-                        exec_start="/opt/scripts/backup.sh",
-                        restart_policy=RestartPolicy.ON_FAILURE,
-                        user="backup",
-                        group="backup",
-                        working_directory="/opt/scripts",
-                        environment_variables={
-                            "BACKUP_DIR": "/backups",
-                            "RETENTION_DAYS": "30",
-                        },
-                        create_timer=True,
-                        timer_config=TimerConfiguration(
-                            on_calendar="*-*-* 02:00:00",  # Daily at 2 AM
-                            persistent=True,
-                            accuracy_sec="5min",
-                        ),
-                        standard_output="journal",
-                        standard_error="journal",
-                        auto_start=False,
-                        auto_enable=True,
-                    ),
-                    required_parameters=["name", "exec_start"],
-                    optional_parameters=["environment_variables", "timer_config"],
-                )
-            )
-
-        logger.info(
-            "Service templates retrieved via API",
-            template_type=template_type,
-            count=len(templates),
+    if not job or job.server_id != server_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Discovery job {job_id} not found",
         )
 
-        return templates
+    return job
 
-    except Exception as e:
-        logger.error("Failed to get service templates via API", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve service templates",
-        )
+
+@router.get(
+    "/stats/overview",
+    response_model=ServiceStatsResponse,
+    summary="Get service statistics",
+    description="Get overview statistics for all services.",
+)
+async def get_service_stats(
+    db: AsyncSession = Depends(get_db_readonly),
+) -> ServiceStatsResponse:
+    """Get service statistics overview."""
+    stats = await service_service.get_service_stats(db)
+    return stats
 
 
 @router.post(
@@ -450,31 +537,18 @@ async def validate_service(
     validation_request: ServiceValidationRequest, db: AsyncSession = Depends(get_db)
 ) -> ServiceValidationResponse:
     """Validate service configuration before creation."""
-    try:
-        result = await service_service.validate_service_creation(
-            db, validation_request.server_id, validation_request.service_config
-        )
+    result = await service_service.validate_service_creation(
+        db, validation_request.server_id, validation_request.service_config
+    )
 
-        logger.info(
-            "Service validation completed via API",
-            server_id=validation_request.server_id,
-            service_name=validation_request.service_config.name,
-            valid=result.valid,
-        )
-
-        return result
+    logger.info(
+        "Service validation completed via API",
+        server_id=validation_request.server_id,
+        service_name=validation_request.service_config.name,
+        valid=result.valid,
+    )
 
-    except Exception as e:
-        logger.error(
-            "Service validation failed via API",
-            server_id=validation_request.server_id,
-            service_name=validation_request.service_config.name,
-            error=str(e),
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Service validation failed",
-        )
+    return result
 
 
 @router.post(
@@ -488,43 +562,28 @@ async def deploy_service(
     deploy_request: ServiceDeployRequest, db: AsyncSession = Depends(get_db)
 ) -> ServiceDeployResponse:
     """Deploy a custom service to a server."""
-    try:
-        result = await service_service.create_custom_service(
-            db,
-            deploy_request.server_id,
-            deploy_request.service_config,
-            dry_run=deploy_request.dry_run,
-        )
-
-        logger.info(
-            "Service deployment completed via API",
-            server_id=deploy_request.server_id,
-            service_name=deploy_request.service_config.name,
-            success=result.success,
-            dry_run=deploy_request.dry_run,
-        )
-
-        if not result.success:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
-            )
-
-        return result
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Service deployment failed via API",
-            server_id=deploy_request.server_id,
-            service_name=deploy_request.service_config.name,
-            error=str(e),
-        )
+    result = await service_service.create_custom_service(
+        db,
+        deploy_request.server_id,
+        deploy_request.service_config,
+        dry_run=deploy_request.dry_run,
+    )
+
+    logger.info(
+        "Service deployment completed via API",
+        server_id=deploy_request.server_id,
+        service_name=deploy_request.service_config.name,
+        success=result.success,
+        dry_run=deploy_request.dry_run,
+    )
+
+    if not result.success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Service deployment failed",
+            status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
         )
 
+    return result
+
 
 @router.put(
     "/{service_id}",
@@ -538,45 +597,22 @@ async def update_service(
     db: AsyncSession = Depends(get_db),
 ) -> ServiceUpdateResponse:
     """Update service configuration using systemd override directories."""
-    try:
-        result = await service_service.update_service(db, service_id, service_data)
+    result = await service_service.update_service(db, service_id, service_data)
 
-        logger.info(
-            "Service update completed via API",
-            service_id=service_id,
-            success=result.success,
-            changes_count=len(result.changes_applied),
-        )
+    logger.info(
+        "Service update completed via API",
+        service_id=service_id,
+        success=result.success,
+        changes_count=len(result.changes_applied),
+    )
 
-        if not result.success:
-            # Return bad request for business logic failures
-            if (
-                "not found" in result.message
-                or "not managed" in result.message
-                or "disabled" in result.message
-            ):
-                raise HTTPException(
-                    status_code=(
-                        status.HTTP_404_NOT_FOUND
-                        if "not found" in result.message
-                        else status.HTTP_400_BAD_REQUEST
-                    ),
-                    detail=result.message,
-                )
-
-        return result
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Service update failed via API", service_id=service_id, error=str(e)
-        )
+    if result.error_kind:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Service update failed",
+            status_code=_ERROR_KIND_STATUS[result.error_kind], detail=result.message
         )
 
+    return result
+
 
 @router.post(
     "/{service_id}/rollback",
@@ -590,42 +626,24 @@ async def rollback_service_configuration(
     db: AsyncSession = Depends(get_db),
 ) -> ServiceUpdateResponse:
     """Rollback service configuration changes."""
-    try:
-        result = await service_service.rollback_service_configuration(
-            db, service_id, rollback_request
-        )
-
-        logger.info(
-            "Service rollback completed via API",
-            service_id=service_id,
-            success=result.success,
-            changes_count=len(result.changes_applied),
-        )
-
-        if not result.success:
-            # Return appropriate error codes
-            if "not found" in result.message:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail=result.message
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
-                )
-
-        return result
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Service rollback failed via API", service_id=service_id, error=str(e)
-        )
+    result = await service_service.rollback_service_configuration(
+        db, service_id, rollback_request
+    )
+
+    logger.info(
+        "Service rollback completed via API",
+        service_id=service_id,
+        success=result.success,
+        changes_count=len(result.changes_applied),
+    )
+
+    if result.error_kind:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Service rollback failed",
+            status_code=_ERROR_KIND_STATUS[result.error_kind], detail=result.message
         )
 
+    return result
+
 
 @router.delete(
     "/{service_id}",
@@ -641,32 +659,20 @@ async def remove_service(
     db: AsyncSession = Depends(get_db),
 ) -> ServiceDeployResponse:
     """Remove a custom service."""
-    try:
-        result = await service_service.remove_custom_service(
-            db, service_id, remove_files=remove_files
-        )
-
-        logger.info(
-            "Service removal completed via API",
-            service_id=service_id,
-            success=result.success,
-            remove_files=remove_files,
-        )
-
-        if not result.success:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
-            )
-
-        return result
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Service removal failed via API", service_id=service_id, error=str(e)
-        )
+    result = await service_service.remove_custom_service(
+        db, service_id, remove_files=remove_files
+    )
+
+    logger.info(
+        "Service removal completed via API",
+        service_id=service_id,
+        success=result.success,
+        remove_files=remove_files,
+    )
+
+    if not result.success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Service removal failed",
+            status_code=status.HTTP_400_BAD_REQUEST, detail=result.message
         )
+
+    return result
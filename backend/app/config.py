@@ -26,6 +26,13 @@ class Settings(BaseSettings):
     database_user: str = "postgres"
     database_password: str = "postgres"
     database_name: str = "owleyes"
+    db_pool_size: int = 25
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 10
+    # Set when connecting through PgBouncer in transaction pooling mode
+    db_pgbouncer: bool = False
+    # Log every SQL statement; kept separate from debug since it is costly
+    db_echo: bool = False
 
     # Security
     secret_key: str = "change-this-in-production"
@@ -75,8 +82,9 @@ class ProductionSettings(Settings):
     log_level: str = "WARNING"
 
 
+@lru_cache()
 def get_environment_settings() -> Settings:
-    """Get settings based on environment."""
+    """Get cached settings based on environment."""
     env = os.getenv("ENVIRONMENT", "development").lower()
 
     if env == "production":
@@ -1,24 +1,50 @@
 """Database configuration and connection management."""
 
+import asyncio
 from datetime import datetime
 from typing import AsyncGenerator
 
-from sqlalchemy import DateTime, MetaData
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import DateTime, func
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, declared_attr, Mapped, mapped_column
 
 from app.config import get_settings
 
 settings = get_settings()
 
-# Create async engine with connection pooling
+# Create async engine with connection pooling. Pre-ping costs an extra
+# round-trip on every checkout; recycling connections after 30 minutes keeps
+# them from going stale instead. LIFO checkout reuses the most recently
+# returned connections so bursts are served by warm ones. The larger prepared
+# statement cache keeps asyncpg from re-preparing the list/filter query
+# variants; PgBouncer in transaction mode cannot hold prepared statements
+# across transactions, so caching is turned off there. JIT is disabled for
+# every session: our queries are short index lookups where LLVM compilation
+# costs far more than execution.
+if settings.db_pgbouncer:
+    connect_args = {
+        "prepared_statement_cache_size": 0,
+        "statement_cache_size": 0,
+    }
+else:
+    connect_args = {"prepared_statement_cache_size": 1024}
+connect_args["server_settings"] = {"jit": "off"}
+
 engine = create_async_engine(
     settings.database_url_computed,
-    echo=settings.debug,
-    pool_size=20,
-    max_overflow=0,
-    pool_pre_ping=True,
-    pool_recycle=300,
+    echo=settings.db_echo,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_use_lifo=True,
+    pool_pre_ping=False,
+    pool_recycle=1800,
+    connect_args=connect_args,
 )
 
 # Create async session factory
@@ -28,31 +54,48 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
-# Metadata for migrations
-metadata = MetaData()
+# Session factory for read-only requests. AUTOCOMMIT connections skip the
+# BEGIN/COMMIT pair, so a single lookup costs one round-trip
+ReadOnlySessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# Task-scoped session registry: each request task gets exactly one session,
+# which is released back to the pool by remove() even if the task is cancelled
+AsyncScopedSession = async_scoped_session(
+    AsyncSessionLocal,
+    scopefunc=asyncio.current_task,
+)
 
 
 class Base(DeclarativeBase):
-    """Base class for all database models."""
+    """Base class for all database models.
 
-    metadata = metadata
+    Tables register on ``Base.metadata``, which is also Alembic's target.
+    """
 
     @declared_attr
     def __tablename__(cls) -> str:
         """Generate table name from class name."""
         return cls.__name__.lower() + "s"
 
-    # Audit fields for all models
+    # Fetch server-generated audit timestamps with RETURNING on flush, so
+    # they are loaded without a lazy refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Audit fields for all models, stamped by PostgreSQL
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False,
         doc="Record creation timestamp",
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
         doc="Record last update timestamp",
     )
@@ -64,15 +107,30 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession: Database session for request handling
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
+    session = AsyncScopedSession()
+    try:
+        yield session
+        # Handlers that already committed leave no open transaction behind
+        if session.in_transaction():
             await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await AsyncScopedSession.remove()
+
+
+async def get_db_readonly() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get a session for read-only endpoints.
+
+    Statements run outside an explicit transaction, so this must not be
+    used by handlers that write.
+
+    Yields:
+        AsyncSession: Autocommit database session
+    """
+    async with ReadOnlySessionLocal() as session:
+        yield session
 
 
 async def init_db() -> None:
@@ -9,21 +9,32 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.api.v1 import api_router
+from app.api.v1.endpoints.health import render_health_check
 from app.config import get_settings
 from app.database import close_db, init_db
+from app.utils.http import (
+    ETagMiddleware,
+    FastPathMiddleware,
+    UnhandledErrorMiddleware,
+)
 
-# Configure structured logging
+# Configure structured logging. Calls below the configured level are
+# dropped by the filtering bound logger before any processor runs
+_log_level = logging.getLevelNamesMapping().get(
+    get_settings().log_level.upper(), logging.INFO
+)
 structlog.configure(
     processors=[
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
         structlog.dev.set_exc_info,
+        structlog.processors.format_exc_info,
         structlog.processors.JSONRenderer(),
     ],
-    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+    wrapper_class=structlog.make_filtering_bound_logger(_log_level),
     logger_factory=structlog.PrintLoggerFactory(),
-    cache_logger_on_first_use=False,
+    cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger()
@@ -58,7 +69,21 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # Add middleware
+    # Add middleware. Unexpected errors are turned into a 500 response
+    # innermost, so the reply still passes through CORSMiddleware
+    app.add_middleware(UnhandledErrorMiddleware)
+    # Only slowly changing resources may be reused without revalidation
+    app.add_middleware(
+        ETagMiddleware,
+        cacheable_paths=r"/api/v1/(servers/\d+|(servers|services)/stats/overview)",
+    )
+
+    # Liveness probes skip routing and the inner middleware, but still pass
+    # the host and CORS checks registered after this
+    app.add_middleware(
+        FastPathMiddleware, path="/api/v1/health", render=render_health_check
+    )
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=[
@@ -66,8 +91,10 @@ def create_app() -> FastAPI:
             "http://localhost:3000",
         ],  # Frontend URLs
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # Explicit lists let Starlette pre-join the preflight headers once
+        # instead of echoing each request's values back
+        allow_methods=["GET", "POST", "PUT", "DELETE"],
+        allow_headers=["Accept", "Authorization", "Content-Type", "If-None-Match"],
     )
 
     app.add_middleware(
@@ -109,4 +136,8 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+        timeout_keep_alive=30,
     )
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from sqlalchemy import DateTime, Enum as SQLEnum, Integer, String, Text, Boolean
+from sqlalchemy import DateTime, Enum as SQLEnum, Index, Integer, String, Text, Boolean
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,6 +25,17 @@ class Server(Base):
     """Server model for managing Linux server connections."""
 
     __tablename__ = "servers"
+    __table_args__ = (
+        # Covers the list endpoint's status/enabled filters
+        Index("ix_servers_status_enabled", "status", "is_enabled"),
+        # Serves tag containment (@>) filters
+        Index(
+            "ix_servers_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -83,8 +94,15 @@ class Server(Base):
     )
 
     # Relationships
+    # Never lazy-loaded: query services explicitly or use selectinload().
+    # Deleting a server leaves the services to the FK's ON DELETE CASCADE
+    # instead of loading and deleting them one by one.
     services: Mapped[List["Service"]] = relationship(
-        "Service", back_populates="server", cascade="all, delete-orphan", lazy="dynamic"
+        "Service",
+        back_populates="server",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -1,18 +1,23 @@
 """Service database model."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
+    DDL,
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     Boolean,
     Float,
+    event,
+    inspect,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -20,6 +25,11 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 
 
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the TIMESTAMP columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class ServiceType(str, Enum):
     """Service type enumeration."""
 
@@ -53,6 +63,44 @@ class Service(Base):
     """Service model for managing systemd and other services."""
 
     __tablename__ = "services"
+    __table_args__ = (
+        # Trigram indexes let the list endpoint's ILIKE '%term%' search use
+        # an index instead of scanning every row
+        Index(
+            "ix_services_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_services_display_name_trgm",
+            "display_name",
+            postgresql_using="gin",
+            postgresql_ops={"display_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_services_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        # Covers the list endpoint's per-server status/enabled filters
+        Index("ix_services_server_status_state", "server_id", "status", "state"),
+        # Serves tag containment (@>) filters
+        Index(
+            "ix_services_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        # Timers are a small subset of units; the partial index serves the
+        # timer count and next-activation ordering without touching the rest
+        Index(
+            "ix_services_timer_next_activation",
+            "next_activation",
+            postgresql_where=text("is_timer"),
+        ),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -70,9 +118,17 @@ class Service(Base):
     display_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # Service type and configuration
+    # Service type and configuration. Enum columns are VARCHAR with a CHECK
+    # constraint rather than native PostgreSQL enum types, so adding a member
+    # needs no ALTER TYPE.
     service_type: Mapped[ServiceType] = mapped_column(
-        SQLEnum(ServiceType, name="service_type"),
+        SQLEnum(
+            ServiceType,
+            name="service_type",
+            native_enum=False,
+            create_constraint=True,
+            length=20,
+        ),
         default=ServiceType.SYSTEMD,
         nullable=False,
         index=True,
@@ -81,13 +137,25 @@ class Service(Base):
 
     # Status information
     status: Mapped[ServiceStatus] = mapped_column(
-        SQLEnum(ServiceStatus, name="service_status"),
+        SQLEnum(
+            ServiceStatus,
+            name="service_status",
+            native_enum=False,
+            create_constraint=True,
+            length=20,
+        ),
         default=ServiceStatus.UNKNOWN,
         nullable=False,
         index=True,
     )
     state: Mapped[ServiceState] = mapped_column(
-        SQLEnum(ServiceState, name="service_state"),
+        SQLEnum(
+            ServiceState,
+            name="service_state",
+            native_enum=False,
+            create_constraint=True,
+            length=20,
+        ),
         default=ServiceState.UNKNOWN,
         nullable=False,
         index=True,
@@ -177,11 +245,16 @@ class Service(Base):
     extra_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Relationships
-    server: Mapped["Server"] = relationship("Server", back_populates="services")
+    # Never lazy-loaded: queries that read the server eager-load it with
+    # selectinload(), so a missing option fails loudly instead of adding
+    # a query per service
+    server: Mapped["Server"] = relationship(
+        "Server", back_populates="services", lazy="raise"
+    )
 
     def __repr__(self) -> str:
         """String representation of the service."""
-        return f"<Service(name='{self.name}', server='{self.server.hostname if self.server else 'None'}', status='{self.status}')>"
+        return f"<Service(name='{self.name}', server_id={self.server_id}, status='{self.status}')>"
 
     @property
     def is_active(self) -> bool:
@@ -200,7 +273,14 @@ class Service(Base):
 
     @property
     def unique_name(self) -> str:
-        """Get unique service identifier including server."""
+        """Get unique service identifier including server.
+
+        Falls back to the server ID when the server was not loaded, since
+        the relationship never loads lazily.
+        """
+        state = inspect(self)
+        if state.has_identity and "server" in state.unloaded:
+            return f"{self.server_id}:{self.name}"
         server_hostname = self.server.hostname if self.server else "unknown"
         return f"{server_hostname}:{self.name}"
 
@@ -214,24 +294,49 @@ class Service(Base):
         sub_state: Optional[str] = None,
         error: Optional[str] = None,
     ) -> None:
-        """Update service status information."""
-        self.status = status
-        self.last_status_check = datetime.utcnow()
-
-        if state is not None:
-            self.state = state
-        if main_pid is not None:
-            self.main_pid = main_pid
-        if load_state is not None:
-            self.load_state = load_state
-        if active_state is not None:
-            self.active_state = active_state
-        if sub_state is not None:
-            self.sub_state = sub_state
-        if error is not None:
-            self.status_check_error = error
-        else:
-            self.status_check_error = None
+        """Update service status information.
+
+        Callers updating many services at once should use ``status_values``
+        with a bulk UPDATE instead of flushing each instance.
+        """
+        values = self.status_values(
+            status, state, main_pid, load_state, active_state, sub_state, error
+        )
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    @staticmethod
+    def status_values(
+        status: ServiceStatus,
+        state: Optional[ServiceState] = None,
+        main_pid: Optional[int] = None,
+        load_state: Optional[str] = None,
+        active_state: Optional[str] = None,
+        sub_state: Optional[str] = None,
+        error: Optional[str] = None,
+        checked_at: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Column values a status update sets, keyed by attribute name.
+
+        Optional values that are None are left out so existing data is kept,
+        which makes the result usable as a bulk UPDATE parameter set.
+        """
+        values: Dict[str, Any] = {
+            "status": status,
+            "last_status_check": checked_at or _utcnow(),
+            "status_check_error": error,
+        }
+        optional = {
+            "state": state,
+            "main_pid": main_pid,
+            "load_state": load_state,
+            "active_state": active_state,
+            "sub_state": sub_state,
+        }
+        values.update(
+            (key, value) for key, value in optional.items() if value is not None
+        )
+        return values
 
     def update_resource_usage(
         self,
@@ -269,3 +374,11 @@ class Service(Base):
     def get_systemctl_command(self, action: str) -> str:
         """Get systemctl command for this service."""
         return f"systemctl {action} {self.name}"
+
+
+# gin_trgm_ops comes from the pg_trgm extension
+event.listen(
+    Service.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
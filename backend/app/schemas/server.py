@@ -1,12 +1,19 @@
 """Server-related Pydantic schemas for API requests and responses."""
 
+import ipaddress
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, validator, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 from app.models.server import ServerStatus
 
+# Single labels like 'localhost' or dotted FQDNs
+_HOSTNAME_RE = re.compile(
+    r"^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$"
+)
+
 
 class ServerCreateRequest(BaseModel):
     """Schema for creating a new server."""
@@ -76,31 +83,25 @@ class ServerCreateRequest(BaseModel):
         }
     )
 
-    @validator("hostname")
+    @field_validator("hostname")
+    @classmethod
     def validate_hostname(cls, v):
         """Validate hostname or IP address format."""
-        import re
-        import ipaddress
-
         if not v:
             raise ValueError("Hostname or IP address is required")
 
-        # Try to parse as IP address first
+        # Hostnames and IPv4 addresses both match the pattern, so only
+        # anything else (IPv6) falls through to the slower address parser
+        if _HOSTNAME_RE.match(v):
+            return v
+
         try:
             ipaddress.ip_address(v)
             return v
         except ValueError:
             pass
 
-        # Validate as hostname (allows single words like 'localhost' or FQDNs)
-        if re.match(
-            r"^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$",
-            v,
-        ):
-            return v
-
         raise ValueError("Invalid hostname or IP address format")
-        return v
 
 
 class ServerUpdateRequest(BaseModel):
@@ -190,8 +191,12 @@ class ServerResponse(BaseModel):
 
     @classmethod
     def from_server(cls, server) -> "ServerResponse":
-        """Create response from Server model."""
-        return cls(
+        """Create response from a loaded Server model.
+
+        The values are already typed by the ORM, so the model is constructed
+        without running validation; use only with database rows, not input.
+        """
+        return cls.model_construct(
             id=server.id,
             hostname=server.hostname,
             display_name=server.display_name,
@@ -223,6 +228,45 @@ class ServerResponse(BaseModel):
             is_online=server.is_online,
         )
 
+    @classmethod
+    def from_row(cls, row) -> "ServerResponse":
+        """Create response from a Core row of ``servers`` columns.
+
+        Values come straight from the database with their column types, so
+        the model is constructed without running validation.
+        """
+        return cls.model_construct(
+            id=row.id,
+            hostname=row.hostname,
+            display_name=row.display_name,
+            description=row.description,
+            ssh_port=row.ssh_port,
+            ssh_username=row.ssh_username,
+            ssh_key_path=row.ssh_key_path,
+            has_ssh_password=bool(row.ssh_password_encrypted),
+            has_ssh_key_passphrase=bool(row.ssh_key_passphrase_encrypted),
+            connection_timeout=row.connection_timeout,
+            connection_retries=row.connection_retries,
+            status=row.status,
+            last_seen_at=row.last_seen_at,
+            last_error=row.last_error,
+            os_name=row.os_name,
+            os_version=row.os_version,
+            kernel_version=row.kernel_version,
+            architecture=row.architecture,
+            cpu_cores=row.cpu_cores,
+            total_memory_mb=row.total_memory_mb,
+            total_disk_gb=row.total_disk_gb,
+            is_enabled=row.is_enabled,
+            auto_discover_services=row.auto_discover_services,
+            tags=row.tags,
+            extra_data=row.extra_data,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            ssh_connection_string=f"{row.ssh_username}@{row.hostname}:{row.ssh_port}",
+            is_online=row.status == ServerStatus.ONLINE,
+        )
+
 
 class ServerListResponse(BaseModel):
     """Schema for paginated server list responses."""
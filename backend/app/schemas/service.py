@@ -1,13 +1,17 @@
 """Service-related Pydantic schemas for API requests and responses."""
 
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Literal, Optional
 from enum import Enum
 
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 from app.models.service import ServiceStatus, ServiceState, ServiceType
 
+_SERVICE_NAME_RE = re.compile(r"^[a-zA-Z0-9._-]+$")
+
 
 class SystemdServiceType(str, Enum):
     """Systemd service type enumeration for service creation."""
@@ -91,13 +95,14 @@ class TimerConfiguration(BaseModel):
         return v
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "on_calendar": "daily",
                 "persistent": True,
                 "accuracy_sec": "1min",
             }
-        }
+        },
     )
 
 
@@ -252,9 +257,7 @@ class EnhancedServiceCreateRequest(BaseModel):
     @classmethod
     def validate_service_name(cls, v):
         """Validate service name format."""
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9._-]+$", v):
+        if not _SERVICE_NAME_RE.match(v):
             raise ValueError(
                 "Service name can only contain letters, numbers, dots, underscores, and hyphens"
             )
@@ -271,6 +274,7 @@ class EnhancedServiceCreateRequest(BaseModel):
         return v
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "name": "my-python-app",
@@ -286,7 +290,7 @@ class EnhancedServiceCreateRequest(BaseModel):
                 "auto_start": True,
                 "auto_enable": True,
             }
-        }
+        },
     )
 
 
@@ -301,6 +305,8 @@ class ServiceDeployRequest(BaseModel):
         False, description="Validate configuration without creating the service"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceDeployResponse(BaseModel):
     """Schema for service deployment results."""
@@ -328,6 +334,8 @@ class ServiceDeployResponse(BaseModel):
         None, description="Preview of generated systemd files"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceTemplateRequest(BaseModel):
     """Schema for requesting service templates."""
@@ -337,6 +345,8 @@ class ServiceTemplateRequest(BaseModel):
         None, description="Template parameters"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceTemplateResponse(BaseModel):
     """Schema for service template responses."""
@@ -349,6 +359,8 @@ class ServiceTemplateResponse(BaseModel):
     required_parameters: List[str] = Field(description="List of required parameters")
     optional_parameters: List[str] = Field(description="List of optional parameters")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceValidationRequest(BaseModel):
     """Schema for validating service configuration before creation."""
@@ -358,6 +370,8 @@ class ServiceValidationRequest(BaseModel):
         ..., description="Service configuration to validate"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceValidationResponse(BaseModel):
     """Schema for service validation results."""
@@ -390,16 +404,20 @@ class ServiceValidationResponse(BaseModel):
 
     timestamp: datetime = Field(description="When the validation was performed")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceControlRequest(BaseModel):
     """Schema for controlling a service (start, stop, restart, etc.)."""
 
-    action: str = Field(
+    action: Literal["start", "stop", "restart", "reload", "enable", "disable"] = Field(
         ...,
         description="Action to perform: start, stop, restart, reload, enable, disable",
     )
 
-    model_config = ConfigDict(json_schema_extra={"example": {"action": "restart"}})
+    model_config = ConfigDict(
+        defer_build=True, json_schema_extra={"example": {"action": "restart"}}
+    )
 
 
 class ServiceControlResponse(BaseModel):
@@ -411,6 +429,8 @@ class ServiceControlResponse(BaseModel):
     action: str = Field(description="Action that was performed")
     timestamp: datetime = Field(description="When the operation was performed")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceLogsRequest(BaseModel):
     """Schema for requesting service logs."""
@@ -433,6 +453,7 @@ class ServiceLogsRequest(BaseModel):
     )
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "lines": 100,
@@ -441,7 +462,7 @@ class ServiceLogsRequest(BaseModel):
                 "priority": "warning",
                 "grep": "error",
             }
-        }
+        },
     )
 
 
@@ -454,6 +475,8 @@ class ServiceLogsResponse(BaseModel):
     lines_returned: int = Field(description="Number of log lines returned")
     timestamp: datetime = Field(description="When logs were retrieved")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceResponse(BaseModel):
     """Schema for service API responses."""
@@ -537,76 +560,63 @@ class ServiceResponse(BaseModel):
         description="Hostname of the server this service runs on"
     )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
     @classmethod
-    def from_service(cls, service) -> "ServiceResponse":
-        """Create response from Service model."""
-        return cls(
-            id=service.id,
-            server_id=service.server_id,
-            name=service.name,
-            display_name=service.display_name,
-            description=service.description,
-            service_type=service.service_type,
-            unit_file_path=service.unit_file_path,
-            status=service.status,
-            state=service.state,
-            main_pid=service.main_pid,
-            load_state=service.load_state,
-            active_state=service.active_state,
-            sub_state=service.sub_state,
-            exec_start=service.exec_start,
-            exec_reload=service.exec_reload,
-            exec_stop=service.exec_stop,
-            restart_policy=service.restart_policy,
-            dependencies=service.dependencies,
-            dependents=service.dependents,
-            conflicts=service.conflicts,
-            is_timer=service.is_timer,
-            timer_schedule=service.timer_schedule,
-            next_activation=service.next_activation,
-            last_activation=service.last_activation,
-            cpu_usage_percent=service.cpu_usage_percent,
-            memory_usage_mb=service.memory_usage_mb,
-            memory_limit_mb=service.memory_limit_mb,
-            started_at=service.started_at,
-            active_duration_seconds=service.active_duration_seconds,
-            last_status_check=service.last_status_check,
-            status_check_error=service.status_check_error,
-            auto_restart=service.auto_restart,
-            environment_variables=service.environment_variables,
-            service_config=service.service_config,
-            override_config=service.override_config,
-            is_managed=service.is_managed,
-            is_monitored=service.is_monitored,
-            tags=service.tags,
-            extra_data=service.extra_data,
-            created_at=service.created_at,
-            updated_at=service.updated_at,
-            is_active=service.is_active,
-            is_failed=service.is_failed,
-            is_enabled=service.is_enabled,
-            unique_name=service.unique_name,
-            server_hostname=service.server.hostname if service.server else "Unknown",
+    def from_row(cls, row) -> "ServiceResponse":
+        """Create response from a Core row of ``services`` columns.
+
+        The row must also carry the server's hostname as ``server_hostname``.
+        Values come straight from the database with their column types, so
+        the model is constructed without running validation.
+        """
+        values = dict(zip(_SERVICE_COLUMN_FIELDS, _get_service_columns(row)))
+        return cls.model_construct(
+            **values,
+            is_active=row.status == ServiceStatus.ACTIVE,
+            is_failed=row.status == ServiceStatus.FAILED,
+            is_enabled=row.state == ServiceState.ENABLED,
+            unique_name=f"{row.server_hostname}:{row.name}",
+            server_hostname=row.server_hostname,
         )
 
 
+# ServiceResponse fields copied as-is from services columns; from_row
+# fetches them in one C-level attrgetter call instead of ~40 attribute lookups
+_SERVICE_COLUMN_FIELDS = tuple(
+    name
+    for name in ServiceResponse.model_fields
+    if name
+    not in {"is_active", "is_failed", "is_enabled", "unique_name", "server_hostname"}
+)
+_get_service_columns = attrgetter(*_SERVICE_COLUMN_FIELDS)
+
+
 class ServiceListResponse(BaseModel):
     """Schema for paginated service list responses."""
 
     services: List[ServiceResponse]
-    total: int
+    total: Optional[int] = Field(
+        description="Total number of matching services, null if not requested"
+    )
     page: int = Field(ge=1, description="Current page number")
     per_page: int = Field(ge=1, le=100, description="Items per page")
-    total_pages: int = Field(description="Total number of pages")
+    total_pages: Optional[int] = Field(
+        description="Total number of pages, null if not requested"
+    )
 
     # Filters applied
     server_id: Optional[int] = Field(None, description="Server ID filter applied")
     status_filter: Optional[str] = Field(None, description="Status filter applied")
     search_query: Optional[str] = Field(None, description="Search query applied")
 
+    # Keyset pagination
+    next_cursor: Optional[int] = Field(
+        None, description="Pass as after_id to fetch the next page"
+    )
+
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "services": [],
@@ -617,8 +627,9 @@ class ServiceListResponse(BaseModel):
                 "server_id": None,
                 "status_filter": "active",
                 "search_query": None,
+                "next_cursor": None,
             }
-        }
+        },
     )
 
 
@@ -632,6 +643,8 @@ class ServiceDiscoveryRequest(BaseModel):
         None, description="Limit discovery to specific service types"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceDiscoveryResponse(BaseModel):
     """Schema for service discovery results."""
@@ -647,6 +660,27 @@ class ServiceDiscoveryResponse(BaseModel):
     )
     timestamp: datetime = Field(description="When discovery was performed")
 
+    model_config = ConfigDict(defer_build=True)
+
+
+class ServiceDiscoveryJobResponse(BaseModel):
+    """Schema for a background service discovery job."""
+
+    job_id: str = Field(description="Job identifier to poll for the result")
+    server_id: int = Field(description="Server being discovered")
+    status: Literal["pending", "running", "completed", "failed"] = Field(
+        description="Current job status"
+    )
+    result: Optional[ServiceDiscoveryResponse] = Field(
+        None, description="Discovery results once the job has finished"
+    )
+    error_message: Optional[str] = Field(
+        None, description="Error message if the job failed"
+    )
+    created_at: datetime = Field(description="When the job was submitted")
+
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceStatsResponse(BaseModel):
     """Schema for service statistics overview."""
@@ -664,6 +698,7 @@ class ServiceStatsResponse(BaseModel):
     timer_services: int = Field(description="Number of timer services")
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "total_services": 150,
@@ -678,7 +713,7 @@ class ServiceStatsResponse(BaseModel):
                 },
                 "timer_services": 15,
             }
-        }
+        },
     )
 
 
@@ -727,6 +762,7 @@ class ServiceCreateRequest(BaseModel):
     )
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "name": "my-custom-service",
@@ -735,7 +771,7 @@ class ServiceCreateRequest(BaseModel):
                 "restart_policy": "on-failure",
                 "auto_restart": True,
             }
-        }
+        },
     )
 
 
@@ -841,6 +877,7 @@ class ServiceOverrideConfig(BaseModel):
     )
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "restart_policy": "on-failure",
@@ -849,7 +886,7 @@ class ServiceOverrideConfig(BaseModel):
                 "environment_variables": {"LOG_LEVEL": "INFO"},
                 "no_new_privileges": True,
             }
-        }
+        },
     )
 
 
@@ -933,6 +970,7 @@ class ServiceUpdateRequest(BaseModel):
         return v
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "display_name": "Updated Service Name",
@@ -949,7 +987,7 @@ class ServiceUpdateRequest(BaseModel):
                 "apply_immediately": True,
                 "create_backup": True,
             }
-        }
+        },
     )
 
 
@@ -958,6 +996,9 @@ class ServiceUpdateResponse(BaseModel):
 
     success: bool = Field(description="Whether the update was successful")
     message: str = Field(description="Update result message")
+    error_kind: Optional[Literal["not_found", "invalid", "conflict"]] = Field(
+        None, description="Failure category for unsuccessful requests"
+    )
     service_id: int = Field(description="ID of the updated service")
     service_name: str = Field(description="Name of the service")
     server_hostname: str = Field(description="Hostname of the server")
@@ -993,6 +1034,8 @@ class ServiceUpdateResponse(BaseModel):
 
     timestamp: datetime = Field(description="When the update was performed")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ServiceRollbackRequest(BaseModel):
     """Schema for rolling back service configuration changes."""
@@ -1007,7 +1050,8 @@ class ServiceRollbackRequest(BaseModel):
     restart_service: bool = Field(True, description="Restart service after rollback")
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {"rollback_to_backup": True, "restart_service": True}
-        }
+        },
     )
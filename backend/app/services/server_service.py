@@ -1,10 +1,11 @@
 """Server management service layer."""
 
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import structlog
 from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.server import Server, ServerStatus
@@ -16,6 +17,7 @@ from app.schemas.server import (
     ServerSystemInfoResponse,
 )
 from app.services.ssh_manager import ssh_manager, SSHConnectionError
+from app.utils.cache import TTLCache
 
 logger = structlog.get_logger()
 
@@ -23,37 +25,64 @@ logger = structlog.get_logger()
 class ServerService:
     """Service class for server management operations."""
 
+    def __init__(self) -> None:
+        # Stats overview and list pages are polled by the dashboard; keep
+        # them in memory briefly
+        self._stats_cache = TTLCache(ttl=30, maxsize=1)
+        self._list_cache = TTLCache(ttl=15, maxsize=256)
+        self._detail_cache = TTLCache(ttl=5, maxsize=1024)
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached data derived from the servers table."""
+        self._stats_cache.clear()
+        self._list_cache.clear()
+        self._detail_cache.clear()
+
     async def create_server(
         self, db: AsyncSession, server_data: ServerCreateRequest
-    ) -> ServerResponse:
-        """Create a new server."""
+    ) -> Optional[ServerResponse]:
+        """Create a new server.
+
+        Returns None if a server with the same hostname already exists.
+        """
         try:
             # TODO: Encrypt sensitive fields before storing
             # For now, we'll store them as-is but this needs encryption in production
             encrypted_password = server_data.ssh_password  # TODO: Encrypt
             encrypted_passphrase = server_data.ssh_key_passphrase  # TODO: Encrypt
 
-            server = Server(
-                hostname=server_data.hostname,
-                display_name=server_data.display_name,
-                description=server_data.description,
-                ssh_port=server_data.ssh_port,
-                ssh_username=server_data.ssh_username,
-                ssh_key_path=server_data.ssh_key_path,
-                ssh_password_encrypted=encrypted_password,
-                ssh_key_passphrase_encrypted=encrypted_passphrase,
-                connection_timeout=server_data.connection_timeout,
-                connection_retries=server_data.connection_retries,
-                is_enabled=server_data.is_enabled,
-                auto_discover_services=server_data.auto_discover_services,
-                tags=server_data.tags,
-                extra_data=server_data.extra_data,
-                status=ServerStatus.OFFLINE,
+            # Insert and uniqueness check in one statement, so concurrent
+            # creates of the same hostname cannot race each other
+            stmt = (
+                insert(Server)
+                .values(
+                    hostname=server_data.hostname,
+                    display_name=server_data.display_name,
+                    description=server_data.description,
+                    ssh_port=server_data.ssh_port,
+                    ssh_username=server_data.ssh_username,
+                    ssh_key_path=server_data.ssh_key_path,
+                    ssh_password_encrypted=encrypted_password,
+                    ssh_key_passphrase_encrypted=encrypted_passphrase,
+                    connection_timeout=server_data.connection_timeout,
+                    connection_retries=server_data.connection_retries,
+                    is_enabled=server_data.is_enabled,
+                    auto_discover_services=server_data.auto_discover_services,
+                    tags=server_data.tags,
+                    extra_data=server_data.extra_data,
+                    status=ServerStatus.OFFLINE,
+                )
+                .on_conflict_do_nothing(index_elements=[Server.hostname])
+                .returning(Server)
             )
+            result = await db.execute(stmt)
+            server = result.scalar_one_or_none()
+
+            if not server:
+                return None
 
-            db.add(server)
             await db.commit()
-            await db.refresh(server)
+            self._invalidate_caches()
 
             logger.info("Server created", server_id=server.id, hostname=server.hostname)
 
@@ -72,6 +101,10 @@ class ServerService:
         self, db: AsyncSession, server_id: int
     ) -> Optional[ServerResponse]:
         """Get a server by ID."""
+        cached = self._detail_cache.get(server_id)
+        if cached is not None:
+            return cached
+
         stmt = select(Server).where(Server.id == server_id)
         result = await db.execute(stmt)
         server = result.scalar_one_or_none()
@@ -79,7 +112,9 @@ class ServerService:
         if not server:
             return None
 
-        return ServerResponse.from_server(server)
+        server_response = ServerResponse.from_server(server)
+        self._detail_cache.set(server_id, server_response)
+        return server_response
 
     async def get_server_by_hostname(
         self, db: AsyncSession, hostname: str
@@ -102,10 +137,29 @@ class ServerService:
         search: Optional[str] = None,
         status_filter: Optional[ServerStatus] = None,
         enabled_only: bool = False,
+        tags: Optional[Dict[str, str]] = None,
     ) -> Tuple[List[ServerResponse], int]:
-        """List servers with pagination and filtering."""
-        # Build base statement
-        stmt = select(Server)
+        """List servers with pagination and filtering.
+
+        ``tags`` keeps servers whose tags include every given key/value pair.
+        """
+        cache_key = (
+            page,
+            per_page,
+            search,
+            status_filter,
+            enabled_only,
+            tuple(sorted(tags.items())) if tags else None,
+        )
+        cached = self._list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Build base statement; the window count returns the filtered total
+        # alongside each row so the page needs a single round-trip.
+        # ServerResponse only reads columns, so select plain table rows and
+        # skip ORM instances and the identity map altogether.
+        stmt = select(Server.__table__, func.count().over().label("total"))
 
         # Apply filters
         filters = []
@@ -124,24 +178,35 @@ class ServerService:
         if enabled_only:
             filters.append(Server.is_enabled == True)
 
-        if filters:
-            stmt = stmt.where(and_(*filters))
+        if tags:
+            # JSONB containment (@>) is served by the tags GIN index
+            filters.append(Server.tags.contains(tags))
 
-        # Get total count
-        count_stmt = select(func.count(Server.id))
         if filters:
-            count_stmt = count_stmt.where(and_(*filters))
-        count_result = await db.execute(count_stmt)
-        total = count_result.scalar()
+            stmt = stmt.where(and_(*filters))
 
         # Apply pagination and ordering
         stmt = stmt.order_by(desc(Server.updated_at))
         stmt = stmt.offset((page - 1) * per_page).limit(per_page)
 
         result = await db.execute(stmt)
-        servers = result.scalars().all()
-        server_responses = [ServerResponse.from_server(server) for server in servers]
-
+        rows = result.all()
+
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Page past the end: no rows to carry the window count
+            count_stmt = select(func.count(Server.id))
+            if filters:
+                count_stmt = count_stmt.where(and_(*filters))
+            count_result = await db.execute(count_stmt)
+            total = count_result.scalar()
+        else:
+            total = 0
+
+        server_responses = [ServerResponse.from_row(row) for row in rows]
+
+        self._list_cache.set(cache_key, (server_responses, total))
         return server_responses, total
 
     async def update_server(
@@ -177,6 +242,7 @@ class ServerService:
 
             await db.commit()
             await db.refresh(server)
+            self._invalidate_caches()
 
             logger.info("Server updated", server_id=server.id, hostname=server.hostname)
 
@@ -204,6 +270,7 @@ class ServerService:
             hostname = server.hostname
             await db.delete(server)
             await db.commit()
+            self._invalidate_caches()
 
             logger.info("Server deleted", server_id=server_id, hostname=hostname)
             return True
@@ -243,6 +310,7 @@ class ServerService:
                 message = error_msg or "Connection failed"
 
             await db.commit()
+            self._invalidate_caches()
 
             logger.info(
                 "Connection test completed",
@@ -258,6 +326,7 @@ class ServerService:
             error_msg = f"Connection test error: {str(e)}"
             server.mark_error(error_msg)
             await db.commit()
+            self._invalidate_caches()
 
             logger.error(
                 "Connection test failed",
@@ -293,6 +362,7 @@ class ServerService:
             server.mark_online()
 
             await db.commit()
+            self._invalidate_caches()
 
             logger.info(
                 "System info gathered", server_id=server_id, hostname=server.hostname
@@ -312,6 +382,7 @@ class ServerService:
         except SSHConnectionError as e:
             server.mark_error(str(e))
             await db.commit()
+            self._invalidate_caches()
             logger.error(
                 "Failed to gather system info",
                 server_id=server_id,
@@ -329,6 +400,10 @@ class ServerService:
 
     async def get_server_stats(self, db: AsyncSession) -> ServerStatsResponse:
         """Get server statistics overview."""
+        cached = self._stats_cache.get(None)
+        if cached is not None:
+            return cached
+
         try:
             # Count servers by status
             stmt = select(Server.status, func.count(Server.id)).group_by(Server.status)
@@ -338,13 +413,15 @@ class ServerService:
             servers_by_status = {status.value: count for status, count in status_counts}
             total_servers = sum(servers_by_status.values())
 
-            return ServerStatsResponse(
+            stats = ServerStatsResponse(
                 total_servers=total_servers,
                 online_servers=servers_by_status.get(ServerStatus.ONLINE.value, 0),
                 offline_servers=servers_by_status.get(ServerStatus.OFFLINE.value, 0),
                 error_servers=servers_by_status.get(ServerStatus.ERROR.value, 0),
                 servers_by_status=servers_by_status,
             )
+            self._stats_cache.set(None, stats)
+            return stats
 
         except Exception as e:
             logger.error("Failed to get server stats", error=str(e))
@@ -373,6 +450,7 @@ class ServerService:
                 server.mark_offline(error_msg)
 
             await db.commit()
+            self._invalidate_caches()
 
         except Exception as e:
             logger.error(
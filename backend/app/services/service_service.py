@@ -1,20 +1,42 @@
 """Service management service layer."""
 
+import asyncio
 from datetime import datetime
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Set, Tuple
+from uuid import uuid4
 
 import structlog
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    bindparam,
+    desc,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.database import AsyncSessionLocal
 from app.models.server import Server
-from app.models.service import Service, ServiceStatus, ServiceState, ServiceType
+from app.models.service import (
+    Service,
+    ServiceStatus,
+    ServiceState,
+    ServiceType,
+    _utcnow,
+)
 from app.schemas.service import (
     ServiceControlResponse,
     ServiceLogsResponse,
     ServiceResponse,
     ServiceDiscoveryResponse,
+    ServiceDiscoveryJobResponse,
     ServiceStatsResponse,
     EnhancedServiceCreateRequest,
     ServiceDeployResponse,
@@ -24,29 +46,153 @@ from app.schemas.service import (
     ServiceRollbackRequest,
 )
 from app.services.ssh_manager import ssh_manager, SSHConnectionError
+from app.utils.cache import TTLCache
 
 logger = structlog.get_logger()
 
 
+# Background discovery jobs allowed to hold an SSH session at once
+_MAX_CONCURRENT_DISCOVERIES = 4
+
+# Offset pages up to this one are served from the in-process list cache
+_CACHED_LIST_PAGES = 2
+
+
+class _ListShape(NamedTuple):
+    """Which optional filters a service list query applies."""
+
+    by_server: bool
+    by_search: bool
+    by_status: bool
+    by_type: bool
+    by_tags: bool
+    enabled_only: bool
+
+
+def _list_filters(shape: _ListShape) -> List[ColumnElement[bool]]:
+    """Build the WHERE clauses for a filter shape, with values as bind params."""
+    filters: List[ColumnElement[bool]] = []
+
+    if shape.by_server:
+        filters.append(Service.server_id == bindparam("server_id"))
+
+    if shape.by_search:
+        pattern = bindparam("search")
+        filters.append(
+            or_(
+                Service.name.ilike(pattern),
+                Service.display_name.ilike(pattern),
+                Service.description.ilike(pattern),
+            )
+        )
+
+    if shape.by_status:
+        filters.append(Service.status == bindparam("status"))
+
+    if shape.by_type:
+        filters.append(Service.service_type == bindparam("service_type"))
+
+    if shape.by_tags:
+        # JSONB containment (@>) is served by the tags GIN index
+        filters.append(Service.tags.contains(bindparam("tags", type_=JSONB)))
+
+    if shape.enabled_only:
+        filters.append(Service.state == ServiceState.ENABLED)
+
+    return filters
+
+
+# List statements are built once per filter shape and reused with fresh
+# parameters, so requests skip statement construction entirely
+@lru_cache(maxsize=128)
+def _list_services_statement(shape: _ListShape, keyset: bool, counted: bool) -> Select:
+    """Page query for a filter shape."""
+    # ServiceResponse only reads columns, so select plain table rows plus
+    # the server's hostname and skip ORM instances altogether
+    columns = [Service.__table__, Server.hostname.label("server_hostname")]
+    if counted:
+        # The window count returns the filtered total alongside each row
+        columns.append(func.count().over().label("total"))
+    query = select(*columns).join(Server, Service.server_id == Server.id)
+
+    filters = _list_filters(shape)
+    if filters:
+        query = query.filter(and_(*filters))
+
+    if keyset:
+        # Seek past the cursor on the primary key index instead of
+        # scanning and discarding OFFSET rows
+        query = query.filter(Service.id > bindparam("after_id"))
+        return query.order_by(Service.id).limit(bindparam("limit"))
+
+    query = query.order_by(Service.name, desc(Service.updated_at))
+    return query.offset(bindparam("offset")).limit(bindparam("limit"))
+
+
+@lru_cache(maxsize=32)
+def _count_services_statement(shape: _ListShape) -> Select:
+    """Total count query for a filter shape."""
+    query = select(func.count(Service.id))
+    filters = _list_filters(shape)
+    if filters:
+        query = query.filter(and_(*filters))
+    return query
+
+
 class ServiceService:
     """Service class for service management operations."""
 
+    def __init__(self) -> None:
+        # Stats overview is polled by the dashboard; keep it in memory briefly
+        self._stats_cache = TTLCache(ttl=5, maxsize=1)
+        # Dashboards poll the first pages with the same filters; deeper
+        # pages and cursor pages are rarely repeated and are not cached
+        self._list_cache = TTLCache(ttl=5, maxsize=256)
+        # Finished discovery jobs stay pollable for an hour
+        self._discovery_jobs = TTLCache(ttl=3600, maxsize=256)
+        self._discovery_tasks: Set[asyncio.Task] = set()
+        self._discovery_slots = asyncio.Semaphore(_MAX_CONCURRENT_DISCOVERIES)
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached data derived from the services table."""
+        self._stats_cache.clear()
+        self._list_cache.clear()
+
     async def get_service(
         self, db: AsyncSession, service_id: int
     ) -> Optional[ServiceResponse]:
         """Get a service by ID."""
+        # One joined select instead of a second selectinload query for the
+        # server; the response only needs its hostname
         query = (
-            select(Service)
-            .options(selectinload(Service.server))
+            select(Service.__table__, Server.hostname.label("server_hostname"))
+            .join(Server, Service.server_id == Server.id)
             .filter(Service.id == service_id)
         )
         result = await db.execute(query)
-        service = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not service:
+        if row is None:
             return None
 
-        return ServiceResponse.from_service(service)
+        return ServiceResponse.from_row(row)
+
+    async def get_service_version(
+        self, db: AsyncSession, service_id: int
+    ) -> Optional[Tuple[datetime, str]]:
+        """Get the fields that change whenever a service's details change.
+
+        Returns the service's ``updated_at`` and its server's hostname (the
+        only server field in ServiceResponse), or None if it does not exist.
+        """
+        query = (
+            select(Service.updated_at, Server.hostname)
+            .join(Server, Service.server_id == Server.id)
+            .filter(Service.id == service_id)
+        )
+        result = await db.execute(query)
+        row = result.first()
+        return (row.updated_at, row.hostname) if row else None
 
     async def list_services(
         self,
@@ -58,53 +204,73 @@ class ServiceService:
         status_filter: Optional[ServiceStatus] = None,
         service_type: Optional[ServiceType] = None,
         enabled_only: bool = False,
-    ) -> Tuple[List[ServiceResponse], int]:
-        """List services with pagination and filtering."""
-        query = select(Service).options(selectinload(Service.server))
-
-        # Apply filters
-        filters = []
-
-        if server_id:
-            filters.append(Service.server_id == server_id)
-
-        if search:
-            search_filter = or_(
-                Service.name.ilike(f"%{search}%"),
-                Service.display_name.ilike(f"%{search}%"),
-                Service.description.ilike(f"%{search}%"),
+        after_id: Optional[int] = None,
+        with_count: bool = True,
+        tags: Optional[Dict[str, str]] = None,
+    ) -> Tuple[List[ServiceResponse], Optional[int]]:
+        """List services with pagination and filtering.
+
+        When ``after_id`` is given, services are ordered by ID and the page
+        starts after that ID (keyset pagination) instead of using ``page``.
+        With ``with_count=False`` no total is computed and None is returned
+        in its place. ``tags`` keeps services whose tags include every given
+        key/value pair.
+        """
+        cache_key = None
+        if after_id is None and page <= _CACHED_LIST_PAGES:
+            cache_key = (
+                page,
+                per_page,
+                server_id,
+                search,
+                status_filter,
+                service_type,
+                enabled_only,
+                with_count,
+                tuple(sorted(tags.items())) if tags else None,
             )
-            filters.append(search_filter)
-
-        if status_filter:
-            filters.append(Service.status == status_filter)
-
-        if service_type:
-            filters.append(Service.service_type == service_type)
-
-        if enabled_only:
-            filters.append(Service.state == ServiceState.ENABLED)
-
-        if filters:
-            query = query.filter(and_(*filters))
-
-        # Get total count
-        count_query = select(func.count(Service.id))
-        if filters:
-            count_query = count_query.filter(and_(*filters))
-        count_result = await db.execute(count_query)
-        total = count_result.scalar()
-
-        # Apply pagination and ordering
-        query = query.order_by(Service.name, desc(Service.updated_at))
-        query = query.offset((page - 1) * per_page).limit(per_page)
-
-        result = await db.execute(query)
-        services = result.scalars().all()
-        service_responses = [
-            ServiceResponse.from_service(service) for service in services
-        ]
-
+            cached = self._list_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        shape = _ListShape(
+            by_server=bool(server_id),
+            by_search=bool(search),
+            by_status=bool(status_filter),
+            by_type=bool(service_type),
+            by_tags=bool(tags),
+            enabled_only=enabled_only,
+        )
+        params = {
+            "server_id": server_id,
+            "search": f"%{search}%" if search else None,
+            "status": status_filter,
+            "service_type": service_type,
+            "tags": tags,
+            "after_id": after_id,
+            "limit": per_page,
+            "offset": (page - 1) * per_page,
+        }
+
+        keyset = after_id is not None
+        query = _list_services_statement(shape, keyset, with_count and not keyset)
+        result = await db.execute(query, params)
+        rows = result.all()
+
+        if not with_count:
+            total = None
+        elif rows and not keyset:
+            total = rows[0].total
+        elif page > 1 or keyset:
+            # No window count to read: keyset page, or a page past the end
+            count_result = await db.execute(_count_services_statement(shape), params)
+            total = count_result.scalar()
+        else:
+            total = 0
+        service_responses = [ServiceResponse.from_row(row) for row in rows]
+
+        if cache_key is not None:
+            self._list_cache.set(cache_key, (service_responses, total))
         return service_responses, total
 
     async def control_service(
@@ -191,17 +357,8 @@ class ServiceService:
                 timestamp=datetime.utcnow(),
             )
 
-    async def get_service_logs(
-        self,
-        db: AsyncSession,
-        service_id: int,
-        lines: int = 100,
-        since: Optional[str] = None,
-        until: Optional[str] = None,
-        priority: Optional[str] = None,
-        grep: Optional[str] = None,
-    ) -> ServiceLogsResponse:
-        """Get logs for a service."""
+    async def _get_log_source(self, db: AsyncSession, service_id: int) -> Service:
+        """Load a service whose logs can be read over SSH."""
         query = (
             select(Service)
             .options(selectinload(Service.server))
@@ -219,6 +376,50 @@ class ServiceService:
         if not service.server.is_enabled:
             raise ValueError(f"Server {service.server.hostname} is disabled")
 
+        return service
+
+    async def stream_service_logs(
+        self,
+        db: AsyncSession,
+        service_id: int,
+        lines: int = 100,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        priority: Optional[str] = None,
+        grep: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Get an iterator over a service's log lines.
+
+        The service is looked up and the SSH connection opened eagerly so
+        errors surface before streaming starts; the returned iterator does
+        not touch the database.
+        """
+        service = await self._get_log_source(db, service_id)
+
+        logger.info(
+            "Streaming service logs",
+            service_id=service_id,
+            service_name=service.name,
+            lines=lines,
+        )
+
+        return await ssh_manager.stream_service_logs(
+            service.server, service.name, lines, since, until, priority, grep
+        )
+
+    async def get_service_logs(
+        self,
+        db: AsyncSession,
+        service_id: int,
+        lines: int = 100,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        priority: Optional[str] = None,
+        grep: Optional[str] = None,
+    ) -> ServiceLogsResponse:
+        """Get logs for a service."""
+        service = await self._get_log_source(db, service_id)
+
         try:
             success, logs = await ssh_manager.get_service_logs(
                 service.server, service.name, lines, since, until, priority, grep
@@ -311,16 +512,23 @@ class ServiceService:
             )
 
         try:
-            # Get current services from database
+            # Discover services via SSH while the current services load from
+            # the database. The SSH task is awaited last so a failure there
+            # never leaves a query running on the session.
+            discovery = asyncio.create_task(ssh_manager.discover_services(server))
             current_services_query = select(Service).filter(
                 Service.server_id == server_id
             )
-            current_services_result = await db.execute(current_services_query)
+            try:
+                current_services_result = await db.execute(current_services_query)
+            except BaseException:
+                discovery.cancel()
+                raise
             current_services = current_services_result.scalars().all()
-            current_service_names = {service.name for service in current_services}
-
-            # Discover services via SSH
-            discovered_services = await ssh_manager.discover_services(server)
+            discovered_services = await discovery
+            current_services_by_name = {
+                service.name: service for service in current_services
+            }
             discovered_service_names = {
                 service["name"] for service in discovered_services
             }
@@ -329,29 +537,34 @@ class ServiceService:
             services_updated = 0
             services_removed = 0
 
+            # Existing services are updated in one bulk UPDATE by primary key
+            # rather than flushing each instance with its own statement
+            checked_at = _utcnow()
+            status_updates: List[Dict[str, Any]] = []
+
             # Add or update discovered services
             for service_data in discovered_services:
                 service_name = service_data["name"]
-                existing_service = next(
-                    (s for s in current_services if s.name == service_name), None
-                )
+                existing_service = current_services_by_name.get(service_name)
 
                 if existing_service:
-                    # Update existing service
-                    existing_service.update_status(
+                    values = Service.status_values(
                         status=service_data["status"],
                         state=service_data["state"],
                         main_pid=service_data.get("main_pid"),
                         load_state=service_data.get("load_state"),
                         active_state=service_data.get("active_state"),
                         sub_state=service_data.get("sub_state"),
+                        checked_at=checked_at,
                     )
-
-                    # Update other fields
-                    existing_service.description = service_data.get("description")
-                    existing_service.exec_start = service_data.get("exec_start")
-                    existing_service.restart_policy = service_data.get("restart_policy")
-                    existing_service.unit_file_path = service_data.get("unit_file_path")
+                    values.update(
+                        id=existing_service.id,
+                        description=service_data.get("description"),
+                        exec_start=service_data.get("exec_start"),
+                        restart_policy=service_data.get("restart_policy"),
+                        unit_file_path=service_data.get("unit_file_path"),
+                    )
+                    status_updates.append(values)
 
                     services_updated += 1
                 else:
@@ -370,12 +583,15 @@ class ServiceService:
                         sub_state=service_data.get("sub_state"),
                         exec_start=service_data.get("exec_start"),
                         restart_policy=service_data.get("restart_policy"),
-                        last_status_check=datetime.utcnow(),
+                        last_status_check=checked_at,
                     )
 
                     db.add(new_service)
                     services_discovered += 1
 
+            if status_updates:
+                await db.execute(update(Service), status_updates)
+
             # Remove services that no longer exist
             for service in current_services:
                 if (
@@ -386,6 +602,7 @@ class ServiceService:
                     services_removed += 1
 
             await db.commit()
+            self._invalidate_caches()
 
             logger.info(
                 "Service discovery completed",
@@ -439,8 +656,73 @@ class ServiceService:
                 timestamp=datetime.utcnow(),
             )
 
+    def start_discovery_job(
+        self, server_id: int, force_refresh: bool = False
+    ) -> ServiceDiscoveryJobResponse:
+        """Run service discovery in the background and return the new job.
+
+        The job opens its own database session, so the submitting request
+        does not hold a connection while SSH discovery runs.
+        """
+        job = ServiceDiscoveryJobResponse(
+            job_id=uuid4().hex,
+            server_id=server_id,
+            status="pending",
+            created_at=datetime.utcnow(),
+        )
+        self._discovery_jobs.set(job.job_id, job)
+
+        task = asyncio.create_task(self._run_discovery_job(job, force_refresh))
+        self._discovery_tasks.add(task)
+        task.add_done_callback(self._discovery_tasks.discard)
+
+        logger.info(
+            "Service discovery job queued", server_id=server_id, job_id=job.job_id
+        )
+        return job.model_copy()
+
+    def get_discovery_job(self, job_id: str) -> Optional[ServiceDiscoveryJobResponse]:
+        """Get a discovery job by ID, or None if unknown or expired."""
+        job = self._discovery_jobs.get(job_id)
+        return job.model_copy() if job else None
+
+    async def _run_discovery_job(
+        self, job: ServiceDiscoveryJobResponse, force_refresh: bool
+    ) -> None:
+        """Execute a queued discovery job and record its outcome."""
+        async with self._discovery_slots:
+            job.status = "running"
+            try:
+                async with AsyncSessionLocal() as db:
+                    result = await self.discover_services(
+                        db, job.server_id, force_refresh
+                    )
+            except ValueError as e:
+                job.status = "failed"
+                job.error_message = str(e)
+            except Exception as e:
+                logger.error(
+                    "Service discovery job failed",
+                    server_id=job.server_id,
+                    job_id=job.job_id,
+                    error=str(e),
+                )
+                job.status = "failed"
+                job.error_message = f"Service discovery failed: {str(e)}"
+            else:
+                job.status = "completed" if result.success else "failed"
+                job.result = result
+                job.error_message = result.error_message
+
+        # Re-store the job so its expiry counts from completion
+        self._discovery_jobs.set(job.job_id, job)
+
     async def get_service_stats(self, db: AsyncSession) -> ServiceStatsResponse:
         """Get service statistics overview."""
+        cached = self._stats_cache.get(None)
+        if cached is not None:
+            return cached
+
         try:
             # Count services by status
             status_query = select(Service.status, func.count(Service.id)).group_by(
@@ -472,7 +754,7 @@ class ServiceService:
             timer_result = await db.execute(timer_query)
             timer_count = timer_result.scalar()
 
-            return ServiceStatsResponse(
+            stats = ServiceStatsResponse(
                 total_services=total_services,
                 active_services=services_by_status.get(ServiceStatus.ACTIVE.value, 0),
                 inactive_services=services_by_status.get(
@@ -483,6 +765,8 @@ class ServiceService:
                 services_by_server=services_by_server,
                 timer_services=timer_count,
             )
+            self._stats_cache.set(None, stats)
+            return stats
 
         except Exception as e:
             logger.error("Failed to get service stats", error=str(e))
@@ -509,6 +793,7 @@ class ServiceService:
                 )
 
                 await db.commit()
+                self._invalidate_caches()
 
         except Exception as e:
             logger.warning(
@@ -785,11 +1070,12 @@ class ServiceService:
                         if service_config.auto_enable
                         else ServiceState.DISABLED
                     ),
-                    last_status_check=datetime.utcnow(),
+                    last_status_check=_utcnow(),
                 )
 
                 db.add(new_service)
                 await db.commit()
+                self._invalidate_caches()
 
                 # Get the created service with its ID
                 await db.refresh(new_service)
@@ -963,6 +1249,7 @@ class ServiceService:
             # Remove service from database
             await db.delete(service)
             await db.commit()
+            self._invalidate_caches()
             actions_performed.append("Removed service from database")
 
             logger.info(
@@ -1016,6 +1303,7 @@ class ServiceService:
                 return ServiceUpdateResponse(
                     success=False,
                     message=f"Service with ID {service_id} not found",
+                    error_kind="not_found",
                     service_id=service_id,
                     service_name="Unknown",
                     server_hostname="Unknown",
@@ -1038,6 +1326,7 @@ class ServiceService:
                 return ServiceUpdateResponse(
                     success=False,
                     message=f"Server {service.server.hostname} is disabled",
+                    error_kind="invalid",
                     service_id=service_id,
                     service_name=service.name,
                     server_hostname=service.server.hostname,
@@ -1050,6 +1339,7 @@ class ServiceService:
                 return ServiceUpdateResponse(
                     success=False,
                     message=f"Service {service.name} is not managed by Owleyes and cannot be edited",
+                    error_kind="invalid",
                     service_id=service_id,
                     service_name=service.name,
                     server_hostname=service.server.hostname,
@@ -1211,6 +1501,7 @@ class ServiceService:
 
             # Commit database changes
             await db.commit()
+            self._invalidate_caches()
 
             logger.info(
                 "Service updated successfully",
@@ -1279,6 +1570,7 @@ class ServiceService:
                 return ServiceUpdateResponse(
                     success=False,
                     message=f"Service with ID {service_id} not found",
+                    error_kind="not_found",
                     service_id=service_id,
                     service_name="Unknown",
                     server_hostname="Unknown",
@@ -1290,6 +1582,7 @@ class ServiceService:
                 return ServiceUpdateResponse(
                     success=False,
                     message=f"Server {service.server.hostname if service.server else 'Unknown'} is not available",
+                    error_kind="invalid",
                     service_id=service_id,
                     service_name=service.name,
                     server_hostname=(
@@ -1315,6 +1608,7 @@ class ServiceService:
                     return ServiceUpdateResponse(
                         success=False,
                         message=f"Failed to remove override configuration: {message}",
+                        error_kind="invalid",
                         service_id=service_id,
                         service_name=service.name,
                         server_hostname=service.server.hostname,
@@ -1347,6 +1641,7 @@ class ServiceService:
 
             # Commit database changes
             await db.commit()
+            self._invalidate_caches()
 
             logger.info(
                 "Service configuration rolled back successfully",
@@ -1374,6 +1669,7 @@ class ServiceService:
             return ServiceUpdateResponse(
                 success=False,
                 message=error_msg,
+                error_kind="invalid",
                 service_id=service_id,
                 service_name=(
                     service.name if "service" in locals() and service else "Unknown"
@@ -3,7 +3,7 @@
 import asyncio
 import json
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
 import structlog
@@ -36,6 +36,35 @@ class SSHCommandError(Exception):
     pass
 
 
+# Output chunks buffered between the SSH thread and a log stream consumer
+_LOG_STREAM_QUEUE_SIZE = 64
+
+
+class _QueueWriter:
+    """File-like sink that hands remote command output to an asyncio queue.
+
+    ``write`` is called from the executor thread running the command and
+    blocks while the queue is full, so a slow consumer throttles the reader.
+    Once closed, further output is discarded.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        self._loop = loop
+        self._queue = queue
+        self._closed = False
+
+    def write(self, data: Optional[str]) -> None:
+        if self._closed:
+            return
+        asyncio.run_coroutine_threadsafe(self._queue.put(data), self._loop).result()
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._closed = True
+
+
 class SSHConnectionManager:
     """Manager for SSH connections with connection pooling and error handling."""
 
@@ -423,6 +452,50 @@ class SSHConnectionManager:
             )
             return False, error_msg
 
+    def _build_logs_command(
+        self,
+        service_name: str,
+        lines: int,
+        since: Optional[str],
+        until: Optional[str],
+        priority: Optional[str],
+        grep: Optional[str],
+    ) -> str:
+        """Build the journalctl command for a service log query."""
+        cmd_parts = ["sudo", "journalctl", "-u", service_name, "--no-pager"]
+
+        # Add line limit
+        cmd_parts.extend(["-n", str(lines)])
+
+        # Add time filters
+        if since:
+            cmd_parts.extend(["--since", f'"{since}"'])
+        if until:
+            cmd_parts.extend(["--until", f'"{until}"'])
+
+        # Add priority filter (maps to journalctl priority levels)
+        if priority:
+            priority_map = {
+                "debug": "7",
+                "info": "6",
+                "notice": "5",
+                "warning": "4",
+                "err": "3",
+                "crit": "2",
+                "alert": "1",
+                "emerg": "0",
+            }
+            if priority.lower() in priority_map:
+                cmd_parts.extend(["-p", priority_map[priority.lower()]])
+
+        command = " ".join(cmd_parts)
+
+        # Add grep filter if specified
+        if grep:
+            command += f' | grep "{grep}"'
+
+        return command
+
     async def get_service_logs(
         self,
         server: Server,
@@ -437,38 +510,9 @@ class SSHConnectionManager:
         try:
             connection = await self.get_connection(server)
 
-            # Build journalctl command with filters
-            cmd_parts = ["sudo", "journalctl", "-u", service_name, "--no-pager"]
-
-            # Add line limit
-            cmd_parts.extend(["-n", str(lines)])
-
-            # Add time filters
-            if since:
-                cmd_parts.extend(["--since", f'"{since}"'])
-            if until:
-                cmd_parts.extend(["--until", f'"{until}"'])
-
-            # Add priority filter (maps to journalctl priority levels)
-            if priority:
-                priority_map = {
-                    "debug": "7",
-                    "info": "6",
-                    "notice": "5",
-                    "warning": "4",
-                    "err": "3",
-                    "crit": "2",
-                    "alert": "1",
-                    "emerg": "0",
-                }
-                if priority.lower() in priority_map:
-                    cmd_parts.extend(["-p", priority_map[priority.lower()]])
-
-            command = " ".join(cmd_parts)
-
-            # Add grep filter if specified
-            if grep:
-                command += f' | grep "{grep}"'
+            command = self._build_logs_command(
+                service_name, lines, since, until, priority, grep
+            )
 
             result = await self._execute_ssh_command(connection, command)
 
@@ -490,6 +534,65 @@ class SSHConnectionManager:
             )
             return False, error_msg
 
+    async def stream_service_logs(
+        self,
+        server: Server,
+        service_name: str,
+        lines: int = 100,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        priority: Optional[str] = None,
+        grep: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Get an iterator over service log lines as journalctl produces them.
+
+        The connection is opened before the iterator is returned, so
+        connection errors surface before a response is started. If the
+        command exits with an error, the iterator raises SSHCommandError
+        after the output produced so far.
+        """
+        connection = await self.get_connection(server)
+        command = self._build_logs_command(
+            service_name, lines, since, until, priority, grep
+        )
+        return self._stream_command_output(connection, command)
+
+    async def _stream_command_output(
+        self, connection: Connection, command: str
+    ) -> AsyncIterator[str]:
+        """Yield a remote command's stdout line by line."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_LOG_STREAM_QUEUE_SIZE)
+        sink = _QueueWriter(loop, queue)
+
+        def run_command() -> Result:
+            try:
+                return connection.run(command, hide="err", warn=True, out_stream=sink)
+            finally:
+                sink.write(None)
+
+        future = loop.run_in_executor(self._executor, run_command)
+        pending = ""
+        try:
+            while (chunk := await queue.get()) is not None:
+                pending += chunk
+                *complete, pending = pending.split("\n")
+                for line in complete:
+                    yield line
+            if pending:
+                yield pending
+            result = await future
+            if not result.ok:
+                raise SSHCommandError(
+                    result.stderr.strip()
+                    or f"Command exited with status {result.exited}"
+                )
+        finally:
+            # Unblock the command thread if the consumer went away early
+            sink.close()
+            while not queue.empty():
+                queue.get_nowait()
+
     def _convert_cron_to_systemd(self, cron_expression: str) -> str:
         """Convert cron expression to systemd OnCalendar format."""
         # Basic cron to systemd conversion
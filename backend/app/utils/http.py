@@ -0,0 +1,224 @@
+"""HTTP helpers for conditional requests, query parsing and hot-path routes."""
+
+import hashlib
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+from fastapi import HTTPException, Query, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = structlog.get_logger()
+
+
+def compute_etag(body: bytes) -> str:
+    """Compute a strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether an If-None-Match header value matches ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def tag_filters(
+    tag: Optional[List[str]] = Query(
+        None, description="Filter by tag as key:value; repeat to require several"
+    ),
+) -> Optional[Dict[str, str]]:
+    """Dependency parsing repeated ``tag=key:value`` query parameters."""
+    if not tag:
+        return None
+
+    tags: Dict[str, str] = {}
+    for item in tag:
+        key, sep, value = item.partition(":")
+        if not sep or not key:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid tag filter '{item}', expected key:value",
+            )
+        tags[key] = value
+    return tags
+
+
+class PydanticResponse(JSONResponse):
+    """JSON response rendering a Pydantic model with its own serializer.
+
+    The model is encoded straight to bytes by pydantic-core, skipping
+    ``jsonable_encoder`` and the intermediate dict of plain values.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
+
+
+class UnhandledErrorMiddleware:
+    """Log unexpected errors and answer them with a generic JSON 500.
+
+    Registered inside CORSMiddleware so error responses still carry the
+    CORS headers the frontend needs to read them. If the response has
+    already started there is nothing left to replace, and the error is
+    re-raised for the server to close the connection.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            logger.error(
+                "Unhandled exception",
+                method=scope["method"],
+                path=scope["path"],
+                exc_info=exc,
+            )
+            if response_started:
+                raise
+            response = JSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={"detail": "Internal server error"},
+            )
+            await response(scope, receive, send)
+
+
+class ETagMiddleware:
+    """Add ETags to JSON GET responses and answer matching requests with 304.
+
+    Only successful single-chunk responses are hashed; streamed bodies are
+    passed through untouched so they are never buffered in memory. Handlers
+    serving precomputed bodies can set the ETag themselves to skip hashing.
+
+    Paths matching ``cacheable_paths`` may be reused by the browser for
+    ``max_age`` seconds. Everything else is sent with ``no-cache`` so live
+    data such as logs and job status is always revalidated. Handlers that
+    set their own Cache-Control keep it.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        cacheable_paths: Optional[str] = None,
+        max_age: int = 5,
+    ) -> None:
+        self.app = app
+        self.cacheable_paths = re.compile(cacheable_paths) if cacheable_paths else None
+        self.cache_control = f"private, max-age={max_age}, must-revalidate"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        pending_start: Optional[Message] = None
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal pending_start
+
+            if message["type"] == "http.response.start":
+                if 200 <= message["status"] < 300:
+                    # Hold the headers back until the body is known
+                    pending_start = message
+                    return
+                await send(message)
+                return
+
+            if message["type"] != "http.response.body" or pending_start is None:
+                await send(message)
+                return
+
+            start, pending_start = pending_start, None
+            headers = MutableHeaders(scope=start)
+            if message.get("more_body", False) or not headers.get(
+                "content-type", ""
+            ).startswith("application/json"):
+                await send(start)
+                await send(message)
+                return
+
+            etag = headers.get("etag")
+            if etag is None:
+                etag = compute_etag(message.get("body", b""))
+                headers["ETag"] = etag
+            if "cache-control" not in headers:
+                if self.cacheable_paths and self.cacheable_paths.fullmatch(
+                    scope["path"]
+                ):
+                    headers["Cache-Control"] = self.cache_control
+                else:
+                    headers["Cache-Control"] = "no-cache"
+
+            if etag_matches(if_none_match, etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                await send({**start, "status": 304})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+
+class FastPathMiddleware:
+    """Answer GET requests for one exact path without entering the app.
+
+    Meant for liveness probes hit many times per second: ``render`` returns
+    the complete JSON body and routing, dependencies and any middleware
+    registered before this one are skipped.
+    """
+
+    def __init__(self, app: ASGIApp, path: str, render: Callable[[], bytes]) -> None:
+        self.app = app
+        # Match with and without the trailing slash so clients never pay
+        # for the router's redirect
+        self.paths = {path.rstrip("/"), path.rstrip("/") + "/"}
+        self.render = render
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = self.render()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"cache-control", b"no-store"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,53 @@
+"""add_trigram_search_indexes_to_services
+
+Revision ID: 4f2a9c7e1b3d
+Revises: 1d0d6eb79a02
+Create Date: 2026-10-15 09:15:42.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f2a9c7e1b3d"
+down_revision: Union[str, Sequence[str], None] = "1d0d6eb79a02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_services_name_trgm",
+        "services",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_services_display_name_trgm",
+        "services",
+        ["display_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"display_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_services_description_trgm",
+        "services",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_services_description_trgm", table_name="services")
+    op.drop_index("ix_services_display_name_trgm", table_name="services")
+    op.drop_index("ix_services_name_trgm", table_name="services")
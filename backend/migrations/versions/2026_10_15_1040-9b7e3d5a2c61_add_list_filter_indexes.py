@@ -0,0 +1,39 @@
+"""add_list_filter_indexes
+
+Revision ID: 9b7e3d5a2c61
+Revises: 4f2a9c7e1b3d
+Create Date: 2026-10-15 10:40:27.503916
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b7e3d5a2c61"
+down_revision: Union[str, Sequence[str], None] = "4f2a9c7e1b3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_services_server_status_state",
+        "services",
+        ["server_id", "status", "state"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_servers_status_enabled",
+        "servers",
+        ["status", "is_enabled"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_servers_status_enabled", table_name="servers")
+    op.drop_index("ix_services_server_status_state", table_name="services")
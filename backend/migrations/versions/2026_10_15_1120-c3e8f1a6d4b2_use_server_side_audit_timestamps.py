@@ -0,0 +1,52 @@
+"""use_server_side_audit_timestamps
+
+Revision ID: c3e8f1a6d4b2
+Revises: 9b7e3d5a2c61
+Create Date: 2026-10-15 11:20:04.671230
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8f1a6d4b2"
+down_revision: Union[str, Sequence[str], None] = "9b7e3d5a2c61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("servers", "services")
+_COLUMNS = ("created_at", "updated_at")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing values were written with datetime.utcnow(), so they are UTC
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                server_default=sa.text("now()"),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
@@ -0,0 +1,34 @@
+"""add_server_tags_gin_index
+
+Revision ID: e5a1b7c9f3d8
+Revises: c3e8f1a6d4b2
+Create Date: 2026-10-15 12:05:51.284617
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a1b7c9f3d8"
+down_revision: Union[str, Sequence[str], None] = "c3e8f1a6d4b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_servers_tags_gin",
+        "servers",
+        ["tags"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"tags": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_servers_tags_gin", table_name="servers")
@@ -0,0 +1,34 @@
+"""add_service_tags_gin_index
+
+Revision ID: 7d2f4b8e6a19
+Revises: e5a1b7c9f3d8
+Create Date: 2026-10-15 13:10:36.905142
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2f4b8e6a19"
+down_revision: Union[str, Sequence[str], None] = "e5a1b7c9f3d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_services_tags_gin",
+        "services",
+        ["tags"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"tags": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_services_tags_gin", table_name="services")
@@ -0,0 +1,56 @@
+"""convert_service_enums_to_varchar
+
+Revision ID: a8c4e2f0b6d7
+Revises: 7d2f4b8e6a19
+Create Date: 2026-10-15 14:25:13.447920
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c4e2f0b6d7"
+down_revision: Union[str, Sequence[str], None] = "7d2f4b8e6a19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (column, enum type / check constraint name, member names)
+_ENUM_COLUMNS = (
+    ("service_type", "service_type", ("SYSTEMD", "DOCKER", "CUSTOM")),
+    (
+        "status",
+        "service_status",
+        ("ACTIVE", "INACTIVE", "FAILED", "ACTIVATING", "DEACTIVATING", "UNKNOWN"),
+    ),
+    ("state", "service_state", ("ENABLED", "DISABLED", "STATIC", "MASKED", "UNKNOWN")),
+)
+
+
+def _members_sql(members: Sequence[str]) -> str:
+    return ", ".join(f"'{member}'" for member in members)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column, type_name, members in _ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE services ALTER COLUMN {column} "
+            f"TYPE VARCHAR(20) USING {column}::text"
+        )
+        op.create_check_constraint(
+            type_name, "services", f"{column} IN ({_members_sql(members)})"
+        )
+        op.execute(f"DROP TYPE {type_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column, type_name, members in _ENUM_COLUMNS:
+        op.drop_constraint(type_name, "services", type_="check")
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({_members_sql(members)})")
+        op.execute(
+            f"ALTER TABLE services ALTER COLUMN {column} "
+            f"TYPE {type_name} USING {column}::{type_name}"
+        )
@@ -0,0 +1,34 @@
+"""add_timer_partial_index
+
+Revision ID: b1f9d3a7c5e2
+Revises: a8c4e2f0b6d7
+Create Date: 2026-10-15 15:10:48.362051
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b1f9d3a7c5e2"
+down_revision: Union[str, Sequence[str], None] = "a8c4e2f0b6d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_services_timer_next_activation",
+        "services",
+        ["next_activation"],
+        unique=False,
+        postgresql_where=sa.text("is_timer"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_services_timer_next_activation", table_name="services")